@@ -29,7 +29,8 @@ IDPAT = re.compile(r".*\bid:\s*(.*?)\)")
 PARENPAT = re.compile(r"(\(.*?\))")
 SEMIPAT = re.compile(r"(;.*)")
 OPPAT = re.compile(r"(.*)\[(.*)\]")
-CMDPAT = re.compile(r"([A-Za-z]+)")
+# A command word: letters plus argument, or a run without letters
+WORDPAT = re.compile(r"[A-Za-z]+[^A-Za-z\s]*|[^A-Za-z\s]+")
 BLOCKPAT = re.compile(r"^\(Block-([A-Za-z]+):\s*(.*)\)")
 AUXPAT = re.compile(r"^(%[A-Za-z0-9]+)\b *(.*)$")
 
@@ -1182,9 +1183,8 @@ class CNC:
         # strip all spaces
         line = line.replace(" ", "")
 
-        # Insert space before each command
-        line = CMDPAT.sub(r" \1", line).lstrip()
-        return line.split()
+        # Split on whitespace and before each command
+        return WORDPAT.findall(line)
 
     # ----------------------------------------------------------------------
     # @return line,comment
@@ -1348,9 +1348,8 @@ class CNC:
     def breakLine(line):
         if line is None:
             return None
-        # Insert space before each command
-        line = CMDPAT.sub(r" \1", line).lstrip()
-        return line.split()
+        # Split on whitespace and before each command
+        return WORDPAT.findall(line)
 
     # ----------------------------------------------------------------------
     # Create path for one g command
@@ -2273,12 +2272,13 @@ class Block(list):
 
     # ----------------------------------------------------------------------
     def pathMargins(self, xyz):
-        self.xmin = min(self.xmin, min(i[0] for i in xyz))
-        self.ymin = min(self.ymin, min(i[1] for i in xyz))
-        self.zmin = min(self.zmin, min(i[2] for i in xyz))
-        self.xmax = max(self.xmax, max(i[0] for i in xyz))
-        self.ymax = max(self.ymax, max(i[1] for i in xyz))
-        self.zmax = max(self.zmax, max(i[2] for i in xyz))
+        xs, ys, zs = zip(*xyz)
+        self.xmin = min(self.xmin, *xs)
+        self.ymin = min(self.ymin, *ys)
+        self.zmin = min(self.zmin, *zs)
+        self.xmax = max(self.xmax, *xs)
+        self.ymax = max(self.ymax, *ys)
+        self.zmax = max(self.zmax, *zs)
 
 
 # =============================================================================
@@ -2436,10 +2436,14 @@ class GCode:
         self.cnc.initPath()
         self.cnc.resetAllMargins()
         self._blocksExist = False
-        for line in f:
-            self._addLine(line[:-1].replace("\x0d", ""))
+        # Stream through the buffered text reader: every line (comments
+        # and blank lines included) carries block structure, so nothing
+        # can be skipped before decoding.
+        addLine = self._addLine
+        with f:
+            for line in f:
+                addLine(line[:-1].replace("\x0d", ""))
         self._trim()
-        f.close()
         return True
 
     # ----------------------------------------------------------------------
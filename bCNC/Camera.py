@@ -3,6 +3,8 @@
 # Author: vvlachoudis@gmail.com
 # Date: 24-Aug-2014
 
+import time
+
 import utils_core as Utils
 
 try:
@@ -38,6 +40,24 @@ def hasOpenCV():
     return cv is not None
 
 
+# -----------------------------------------------------------------------------
+def cudaDevices():
+    """Number of CUDA devices usable by OpenCV, 0 without CUDA support"""
+    try:
+        return cv.cuda.getCudaEnabledDeviceCount()
+    except (AttributeError, cv.error):
+        return 0
+
+
+# Upper bound of queued frames discarded per read in low latency mode
+DRAIN_MAX = 8
+# A grab() slower than this blocked on a new frame rather than returning
+# one already queued by the driver
+DRAIN_WAIT = 0.005
+# Number of scratch buffer sets cycled by swapBuffers()
+FRAME_BANKS = 2
+
+
 # =============================================================================
 # Camera processing class
 # A wrapper to opencv needed functions
@@ -56,6 +76,16 @@ class Camera:
         self.image = None
         self.frozen = None
         self.imagetk = None
+        # Set before start() to always read the most recent frame
+        self.low_latency = False
+        self._drain = False
+        # Per-frame scratch arrays reused across frames, see _buffer()
+        self._buffers = {}
+        self._bank = 0
+        # Edge detection runs on the GPU when OpenCV was built with CUDA
+        self._gpuSrc = cv.cuda_GpuMat() if cudaDevices() > 0 else None
+        self._gpuCanny = None
+        self._gpuThresholds = None
 
     def _getCameraProperties(self, prefix):
         """Gather user-defined camera configuration properties
@@ -159,6 +189,10 @@ class Camera:
 
         if self.camera is None:
             return
+        # Keep only the newest frame queued; backends that refuse the
+        # buffer size get their queue drained on every read instead
+        self._drain = self.low_latency and not self.camera.set(
+            getattr(cv, "CAP_PROP_BUFFERSIZE", 38), 1)
         s, self.image = self.camera.read()
         if not self.camera.isOpened():
             self.stop()
@@ -190,7 +224,10 @@ class Camera:
     # Read one image and rotated if needed
     # -----------------------------------------------------------------------
     def read(self):
-        s, self.image = self.camera.read()
+        if self._drain:
+            s, self.image = self._readLatest()
+        else:
+            s, self.image = self.camera.read()
         if s:
             self.image = self.rotate90(self.image)
         else:
@@ -201,6 +238,18 @@ class Camera:
             self.image = cv.addWeighted(self.image, 0.7, self.frozen, 0.3, 0.0)
         return s
 
+    # -----------------------------------------------------------------------
+    # Discard the frames queued by the driver and return the newest one
+    # -----------------------------------------------------------------------
+    def _readLatest(self):
+        for _ in range(DRAIN_MAX):
+            t0 = time.monotonic()
+            if not self.camera.grab():
+                return False, None
+            if time.monotonic() - t0 > DRAIN_WAIT:
+                break
+        return self.camera.retrieve()
+
     # -----------------------------------------------------------------------
     # Save image to file
     # -----------------------------------------------------------------------
@@ -211,6 +260,24 @@ class Camera:
         s, jpg = cv.imencode(".jpg", self.image)
         return jpg if s else None
 
+    # -----------------------------------------------------------------------
+    # Return the uint8 scratch array called name, reallocated only when
+    # the requested shape changes
+    # -----------------------------------------------------------------------
+    def _buffer(self, name, shape):
+        key = (name, self._bank)
+        buf = self._buffers.get(key)
+        if buf is None or buf.shape != shape:
+            buf = self._buffers[key] = np.empty(shape, np.uint8)
+        return buf
+
+    # -----------------------------------------------------------------------
+    # Move on to the next set of scratch buffers, so processing a new frame
+    # leaves the arrays of the previous FRAME_BANKS-1 frames untouched
+    # -----------------------------------------------------------------------
+    def swapBuffers(self):
+        self._bank = (self._bank + 1) % FRAME_BANKS
+
     # -----------------------------------------------------------------------
     # Rotate image in steps of 90deg
     # -----------------------------------------------------------------------
@@ -268,20 +335,53 @@ class Camera:
             top = max(h2 - hn, 0)
             bottom = min(h2 + hn, h - 1)
             self.image = self.image[top:bottom, left:right]
+        h, w = self.image.shape[:2]
+        shape = (round(h * factor), round(w * factor)) + self.image.shape[2:]
+        dst = self._buffer("resized", shape)
+        # INTER_AREA avoids aliasing when shrinking
+        interpolation = cv.INTER_AREA if factor < 1.0 else cv.INTER_LINEAR
         try:
-            self.image = cv.resize(self.image, (0, 0), fx=factor, fy=factor)
+            self.image = cv.resize(self.image, (shape[1], shape[0]),
+                                   dst=dst, interpolation=interpolation)
         except Exception:
             # FIXME Too much zoom out, results in void image!
             pass
 
     # -----------------------------------------------------------------------
     # Canny edge detection
+    # Call after resize() so it runs on the smaller display frame
     # -----------------------------------------------------------------------
     def canny(self, threshold1, threshold2):
-        edge = cv.cvtColor(
-            cv.Canny(self.image, threshold1, threshold2), cv.COLOR_GRAY2BGR
-        )
-        self.image = cv.addWeighted(self.image, 0.9, edge, 0.5, 0.0)
+        shape = self.image.shape
+        # Edges of the grayscale frame: one channel instead of three
+        edges = self._buffer("edges", shape[:2])
+        if self._gpuSrc is not None:
+            try:
+                self._cannyGpu(threshold1, threshold2, edges)
+            except cv.error:
+                # Fall back to the CPU for the rest of the session
+                self._gpuSrc = None
+        if self._gpuSrc is None:
+            gray = cv.cvtColor(self.image, cv.COLOR_BGR2GRAY,
+                               dst=self._buffer("gray", shape[:2]))
+            cv.Canny(gray, threshold1, threshold2, edges)
+        edge = cv.cvtColor(edges, cv.COLOR_GRAY2BGR,
+                           dst=self._buffer("edge", shape))
+        self.image = cv.addWeighted(self.image, 0.9, edge, 0.5, 0.0,
+                                    dst=self._buffer("blend", shape))
+
+    # -----------------------------------------------------------------------
+    # Grayscale + Canny of the current image on the GPU, downloaded into
+    # the host array edges
+    # -----------------------------------------------------------------------
+    def _cannyGpu(self, threshold1, threshold2, edges):
+        if self._gpuThresholds != (threshold1, threshold2):
+            self._gpuCanny = cv.cuda.createCannyEdgeDetector(
+                threshold1, threshold2)
+            self._gpuThresholds = (threshold1, threshold2)
+        self._gpuSrc.upload(self.image)
+        gray = cv.cuda.cvtColor(self._gpuSrc, cv.COLOR_BGR2GRAY)
+        self._gpuCanny.detect(gray).download(edges)
 
     # -----------------------------------------------------------------------
     # Freeze and overlay image
@@ -340,14 +440,20 @@ class Camera:
 
     # -----------------------------------------------------------------------
     # Convert to QImage (no PIL dependency)
+    #
+    # Qt reads the BGR frame directly (Format_BGR888), so there is no
+    # colour conversion and no copy: the QImage shares the camera's frame
+    # buffer and stays valid until FRAME_BANKS more frames are processed
+    # (the next one, unless swapBuffers() is used).
     # -----------------------------------------------------------------------
     def toQImage(self):
         if self.image is None:
             return None
-        rgb = cv.cvtColor(self.image, cv.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        bytes_per_line = ch * w
+        image = self.image
+        if not image.flags.c_contiguous:
+            image = self._buffer("bgr", image.shape)
+            image[...] = self.image
+        h, w = image.shape[:2]
         from PySide6.QtGui import QImage
-        # .copy() critical — QImage does not own the numpy buffer
-        return QImage(rgb.data, w, h, bytes_per_line,
-                      QImage.Format.Format_RGB888).copy()
+        return QImage(image.data, w, h, image.strides[0],
+                      QImage.Format.Format_BGR888)
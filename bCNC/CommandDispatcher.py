@@ -6,6 +6,23 @@
 # editor updates; this class handles the GCode transformations.
 
 
+def _direction_abbrevs(*words):
+    """Map every abbreviation of *words* to its full word.
+
+    Earlier words take precedence on shared prefixes, matching the
+    order of the rexx.abbrev() checks this table replaces ("O" is
+    OUTSIDE, not ON; the empty string is INSIDE).
+    """
+    table = {}
+    for word in words:
+        for n in range(len(word) + 1):
+            table.setdefault(word[:n], word)
+    return table
+
+
+_DIRECTIONS = _direction_abbrevs("INSIDE", "OUTSIDE", "ON")
+
+
 class GCodeOperations:
     """Routes GCode manipulation commands to the GCode model.
 
@@ -14,6 +31,28 @@ class GCodeOperations:
     UI layer can act on.
     """
 
+    # cmd -> (operation(gcode, items, args), returns_selection)
+    _DISPATCH = {
+        "AUTOLEVEL": (lambda g, items, args: g.autolevel(items), True),
+        "CUT": (lambda g, items, args: g.cut(items, *args), True),
+        "CLOSE": (lambda g, items, args: g.close(items), True),
+        "DIRECTION": (
+            lambda g, items, args: g.cutDirection(items, *args), True),
+        "DRILL": (lambda g, items, args: g.drill(items, *args), True),
+        "ORDER": (lambda g, items, args: g.orderLines(items, *args), False),
+        "INKSCAPE": (lambda g, items, args: g.inkscapeLines(), False),
+        "ISLAND": (lambda g, items, args: g.island(items, *args), False),
+        "MIRRORH": (lambda g, items, args: g.mirrorHLines(items), False),
+        "MIRRORV": (lambda g, items, args: g.mirrorVLines(items), False),
+        "MOVE": (lambda g, items, args: g.moveLines(items, *args), False),
+        "OPTIMIZE": (lambda g, items, args: g.optimize(items), False),
+        "ORIENT": (lambda g, items, args: g.orientLines(items), False),
+        "REVERSE": (lambda g, items, args: g.reverse(items, *args), False),
+        "ROUND": (lambda g, items, args: g.roundLines(items, *args), False),
+        "ROTATE": (lambda g, items, args: g.rotateLines(items, *args), False),
+        "TABS": (lambda g, items, args: g.createTabs(items, *args), True),
+    }
+
     def __init__(self, gcode, tools=None):
         """
         Args:
@@ -37,42 +76,13 @@ class GCodeOperations:
                   or None if no selection change needed.
                 - status_message: Status text to display.
         """
+        entry = self._DISPATCH.get(cmd)
         sel = None
-
-        if cmd == "AUTOLEVEL":
-            sel = self.gcode.autolevel(items)
-        elif cmd == "CUT":
-            sel = self.gcode.cut(items, *args)
-        elif cmd == "CLOSE":
-            sel = self.gcode.close(items)
-        elif cmd == "DIRECTION":
-            sel = self.gcode.cutDirection(items, *args)
-        elif cmd == "DRILL":
-            sel = self.gcode.drill(items, *args)
-        elif cmd == "ORDER":
-            self.gcode.orderLines(items, *args)
-        elif cmd == "INKSCAPE":
-            self.gcode.inkscapeLines()
-        elif cmd == "ISLAND":
-            self.gcode.island(items, *args)
-        elif cmd == "MIRRORH":
-            self.gcode.mirrorHLines(items)
-        elif cmd == "MIRRORV":
-            self.gcode.mirrorVLines(items)
-        elif cmd == "MOVE":
-            self.gcode.moveLines(items, *args)
-        elif cmd == "OPTIMIZE":
-            self.gcode.optimize(items)
-        elif cmd == "ORIENT":
-            self.gcode.orientLines(items)
-        elif cmd == "REVERSE":
-            self.gcode.reverse(items, *args)
-        elif cmd == "ROUND":
-            self.gcode.roundLines(items, *args)
-        elif cmd == "ROTATE":
-            self.gcode.rotateLines(items, *args)
-        elif cmd == "TABS":
-            sel = self.gcode.createTabs(items, *args)
+        if entry is not None:
+            op, returns_sel = entry
+            result = op(self.gcode, items, args)
+            if returns_sel:
+                sel = result
 
         args_str = " ".join(str(a) for a in args if a is not None)
         status = f"{cmd} {args_str}".strip()
@@ -96,17 +106,17 @@ class GCodeOperations:
                 - warning_message: Warning string or None.
                 - computed_offset: The actual offset used.
         """
-        import rexx
-
         tool = self.tools["EndMill"]
         ofs = self.tools.fromMm(tool["diameter"]) / 2.0
         sign = 1.0
 
+        side = (_DIRECTIONS.get(direction.upper())
+                if direction is not None else None)
         if direction is None:
             pass
-        elif rexx.abbrev("INSIDE", direction.upper()):
+        elif side == "INSIDE":
             sign = -1.0
-        elif rexx.abbrev("OUTSIDE", direction.upper()):
+        elif side == "OUTSIDE":
             sign = 1.0
         else:
             try:
@@ -152,19 +162,19 @@ class GCodeOperations:
         Returns:
             tuple: (warning_message, adaptative_flag, computed_offset)
         """
-        import rexx
-
         adaptedRadius = float(adaptedRadius)
         ofs = float(cutDiam) / 2.0
         sign = 1.0
 
+        side = (_DIRECTIONS.get(direction.upper())
+                if direction is not None else None)
         if direction is None:
             pass
-        elif rexx.abbrev("INSIDE", direction.upper()):
+        elif side == "INSIDE":
             sign = -1.0
-        elif rexx.abbrev("OUTSIDE", direction.upper()):
+        elif side == "OUTSIDE":
             sign = 1.0
-        elif rexx.abbrev("ON", direction.upper()):
+        elif side == "ON":
             ofs = 0
         else:
             try:
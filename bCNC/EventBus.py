@@ -5,7 +5,10 @@
 # both this EventBus and Tkinter events can coexist.
 
 import threading
-from collections import defaultdict
+import time
+
+# Window (seconds) over which emit_latest() coalesces repeated events
+COALESCE_DELAY = 0.016
 
 
 class EventBus:
@@ -15,11 +18,17 @@ class EventBus:
     Subscribers are called synchronously on the emitting thread.
     For UI updates from background threads, combine with a
     toolkit-specific dispatcher (Tk.after, QTimer, etc.).
+
+    Subscriber lists are stored as tuples and replaced (copy-on-write)
+    by on()/off(), so emit() can iterate them without locking or
+    copying.
     """
 
     def __init__(self):
-        self._subscribers = defaultdict(list)
+        self._subscribers = {}
         self._lock = threading.Lock()
+        self._pending = {}    # event_name -> (args, kwargs)
+        self._last_emit = {}  # event_name -> monotonic time of dispatch
 
     def on(self, event_name, callback):
         """Subscribe to an event.
@@ -30,8 +39,9 @@ class EventBus:
                       Receives (*args, **kwargs) passed to emit().
         """
         with self._lock:
-            if callback not in self._subscribers[event_name]:
-                self._subscribers[event_name].append(callback)
+            callbacks = self._subscribers.get(event_name, ())
+            if callback not in callbacks:
+                self._subscribers[event_name] = callbacks + (callback,)
 
     def off(self, event_name, callback):
         """Unsubscribe from an event.
@@ -41,10 +51,14 @@ class EventBus:
             callback: The previously registered callable.
         """
         with self._lock:
-            try:
-                self._subscribers[event_name].remove(callback)
-            except ValueError:
-                pass
+            callbacks = self._subscribers.get(event_name, ())
+            if callback in callbacks:
+                remaining = tuple(cb for cb in callbacks if cb != callback)
+                if remaining:
+                    self._subscribers[event_name] = remaining
+                else:
+                    # Don't keep empty entries around for dead events
+                    del self._subscribers[event_name]
 
     def emit(self, event_name, *args, **kwargs):
         """Emit an event, calling all subscribers.
@@ -53,14 +67,59 @@ class EventBus:
             event_name: String identifier for the event.
             *args, **kwargs: Passed to each subscriber callback.
         """
-        with self._lock:
-            callbacks = list(self._subscribers[event_name])
-        for callback in callbacks:
+        # A direct emit supersedes a value emit_latest() held back
+        if self._pending:
+            with self._lock:
+                self._pending.pop(event_name, None)
+        # .get() never inserts, so emitting an event nobody listens to
+        # leaves the subscriber table untouched
+        for callback in self._subscribers.get(event_name, ()):
             try:
                 callback(*args, **kwargs)
             except Exception:
                 pass
 
+    def emit_latest(self, event_name, *args, **kwargs):
+        """Emit an event, coalescing bursts into few dispatches.
+
+        The event is dispatched at once, on the emitting thread, when
+        at least COALESCE_DELAY seconds have passed since its last
+        dispatch. Within that window only the most recent arguments
+        are kept; they are delivered by the next call outside the
+        window or by flush(), which the caller or the UI idle loop
+        drives. Use for progress/status events where intermediate
+        values are not needed; terminal events should use emit(),
+        which also discards a held-back value.
+        """
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emit.get(event_name)
+            if last is not None and now - last < COALESCE_DELAY:
+                self._pending[event_name] = (args, kwargs)
+                return
+            self._pending.pop(event_name, None)
+            self._last_emit[event_name] = now
+        self.emit(event_name, *args, **kwargs)
+
+    def flush(self, event_name=None):
+        """Dispatch pending emit_latest() events on the calling thread.
+
+        Args:
+            event_name: Flush only this event, or all if None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if event_name is None:
+                names = list(self._pending)
+            else:
+                names = [event_name] if event_name in self._pending else []
+            pending = []
+            for name in names:
+                pending.append((name, self._pending.pop(name)))
+                self._last_emit[name] = now
+        for name, (args, kwargs) in pending:
+            self.emit(name, *args, **kwargs)
+
     def clear(self, event_name=None):
         """Remove all subscribers, optionally for a specific event."""
         with self._lock:
@@ -5,11 +5,36 @@
 # editor refresh, and title bar updates.
 
 import os
+from collections import namedtuple
 
 import utils_core as Utils
 from CNC import GCode
 from EventBus import bus as event_bus
 
+# Import method on GCode per file extension; anything else is G-code
+_IMPORTERS = {
+    ".dxf": "importDXF",
+    ".svg": "importSVG",
+}
+
+# file_type reported by load() per extension; anything else is G-code
+_TYPE_MAP = {
+    ".probe": "probe",
+    ".orient": "orient",
+    ".stl": "mesh_info",
+    ".ply": "mesh_info",
+}
+
+# A filename split once: full path, path without extension, and the
+# lowercase extension used for every type decision
+FileInfo = namedtuple("FileInfo", "path stem ext_lower")
+
+
+def _classify(path):
+    """Split *path* once into a FileInfo."""
+    stem, ext = os.path.splitext(path)
+    return FileInfo(path, stem, ext.lower())
+
 
 class FileManager:
     """Manages file operations for GCode, probe, and orientation files.
@@ -22,7 +47,9 @@ class FileManager:
         "file_saved"        (filename)
         "file_new"          ()
         "file_imported"     (filename, blocks)
-        "status_message"    (message)
+        "status_message"    (message)   progress ("Loading: ...") is
+                                        coalesced via emit_latest();
+                                        final results use emit()
     """
 
     def __init__(self, sender):
@@ -60,21 +87,13 @@ class FileManager:
         Returns:
             str: The file type ("probe", "orient", "mesh_info", "gcode").
         """
-        fn, ext = os.path.splitext(filename)
-        ext = ext.lower()
+        info = _classify(filename)
 
-        event_bus.emit("status_message",
-                       _("Loading: {} ...").format(filename))
-        self._sender.load(filename)
-
-        if ext == ".probe":
-            file_type = "probe"
-        elif ext == ".orient":
-            file_type = "orient"
-        elif ext in (".stl", ".ply"):
-            file_type = "mesh_info"
-        else:
-            file_type = "gcode"
+        event_bus.emit_latest("status_message",
+                              _("Loading: {} ...").format(filename))
+        self._sender.load(filename, info.ext_lower)
+
+        file_type = _TYPE_MAP.get(info.ext_lower, "gcode")
 
         Utils.addRecent(filename)
         event_bus.emit("file_loaded", filename, file_type)
@@ -118,15 +137,9 @@ class FileManager:
         Returns:
             list: The imported GCode blocks, or None on failure.
         """
-        fn, ext = os.path.splitext(filename)
-        ext = ext.lower()
+        info = _classify(filename)
         gcode = GCode()
-        if ext == ".dxf":
-            gcode.importDXF(filename)
-        elif ext == ".svg":
-            gcode.importSVG(filename)
-        else:
-            gcode.load(filename)
+        getattr(gcode, _IMPORTERS.get(info.ext_lower, "load"))(filename)
 
         blocks = gcode.blocks
         event_bus.emit("file_imported", filename, blocks)
@@ -138,7 +151,6 @@ class FileManager:
         Returns:
             tuple: (gcode_modified: bool, probe_modified: bool)
         """
-        gcode_mod = self.gcode.isModified()
-        probe_mod = (not self.gcode.probe.isEmpty()
-                     and not self.gcode.probe.saved)
-        return gcode_mod, probe_mod
+        gcode = self._sender.gcode
+        probe = gcode.probe
+        return gcode.isModified(), not probe.isEmpty() and not probe.saved
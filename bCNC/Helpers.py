@@ -3,8 +3,8 @@ remove them from other files, since there were circular imports.
 XXX: This file might be removed, once the circular imports are cleared.
 """
 
+import builtins
 import os
-import gettext
 import sys
 
 _localedir = os.path.join(
@@ -12,7 +12,22 @@ _localedir = os.path.join(
     else os.path.abspath(os.path.dirname(__file__)),
     "locales",
 )
-gettext.install("bCNC", localedir=_localedir if os.path.isdir(_localedir) else None)
+
+
+def _lazy_gettext(message):
+    """Placeholder _() builtin: installs gettext on first use.
+
+    Keeps the locale directory probe and catalog loading off the
+    import path. gettext.install() replaces builtins._, so every
+    later call goes straight to the real translator.
+    """
+    import gettext
+    gettext.install(
+        "bCNC", localedir=_localedir if os.path.isdir(_localedir) else None)
+    return builtins._(message)
+
+
+builtins._ = _lazy_gettext
 
 __all__ = (
     "to_zip",
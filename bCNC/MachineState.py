@@ -7,7 +7,12 @@
 # MachineState methods.
 
 import threading
-from collections import defaultdict
+
+_MISSING = object()
+
+# Value types safe to compare in the lock-free fast path of set():
+# their == returns a plain bool (unlike e.g. numpy arrays)
+_SCALAR_TYPES = frozenset((int, float, str, bool, type(None)))
 
 
 class _BatchContext:
@@ -30,11 +35,9 @@ class _BatchContext:
                 self._state._batch_changes.clear()
                 all_notifications = []
                 for key, value in changes.items():
-                    observers = list(
-                        self._state._observers.get(key, []))
-                    observers += list(
-                        self._state._observers.get("*", []))
-                    all_notifications.append((key, value, observers))
+                    observers = self._state._observers_for(key)
+                    if observers:
+                        all_notifications.append((key, value, observers))
             else:
                 all_notifications = []
 
@@ -63,7 +66,9 @@ class MachineState:
         """
         self._vars = cnc_vars
         self._lock = threading.Lock()
-        self._observers = defaultdict(list)
+        self._observers = {}   # key -> tuple of callbacks (copy-on-write)
+        # key -> tuple of key-specific + "*" observers, built on demand
+        self._observer_cache = {}
         self._batch_depth = 0
         self._batch_changes = {}
 
@@ -86,6 +91,17 @@ class MachineState:
             key: Variable name.
             value: New value.
         """
+        # Lock-free fast path for the common no-change write (status
+        # polling re-sends the same values); a racing writer only costs
+        # one extra trip through the locked path below. Only same-type
+        # plain scalars qualify, so the fast path never trusts a
+        # cross-type or elementwise (numpy) ==.
+        cur = self._vars.get(key, _MISSING)
+        if (type(cur) is type(value) and type(value) in _SCALAR_TYPES
+                and cur == value):
+            return
+
+        observers = ()
         with self._lock:
             old = self._vars.get(key)
             self._vars[key] = value
@@ -93,11 +109,10 @@ class MachineState:
                 if self._batch_depth > 0:
                     self._batch_changes[key] = value
                 else:
-                    observers = list(self._observers.get(key, []))
-                    observers += list(self._observers.get("*", []))
+                    observers = self._observers_for(key)
 
         # Notify outside the lock to prevent deadlocks
-        if old != value and self._batch_depth == 0:
+        if old != value and self._batch_depth == 0 and observers:
             self._notify(key, value, old, observers)
 
     def update(self, mapping):
@@ -129,8 +144,10 @@ class MachineState:
             callback: Called as callback(key, new_value, old_value).
         """
         with self._lock:
-            if callback not in self._observers[key]:
-                self._observers[key].append(callback)
+            observers = self._observers.get(key, ())
+            if callback not in observers:
+                self._observers[key] = observers + (callback,)
+                self._invalidate_observer_cache(key)
 
     def unobserve(self, key, callback):
         """Remove an observer.
@@ -140,10 +157,27 @@ class MachineState:
             callback: Previously registered callback.
         """
         with self._lock:
-            try:
-                self._observers[key].remove(callback)
-            except ValueError:
-                pass
+            observers = self._observers.get(key, ())
+            if callback in observers:
+                self._observers[key] = tuple(
+                    cb for cb in observers if cb != callback)
+                self._invalidate_observer_cache(key)
+
+    def _observers_for(self, key):
+        """Return the observers to notify for *key* (lock held)."""
+        observers = self._observer_cache.get(key)
+        if observers is None:
+            observers = (self._observers.get(key, ())
+                         + self._observers.get("*", ()))
+            self._observer_cache[key] = observers
+        return observers
+
+    def _invalidate_observer_cache(self, key):
+        """Drop cached observer tuples affected by *key* (lock held)."""
+        if key == "*":
+            self._observer_cache.clear()
+        else:
+            self._observer_cache.pop(key, None)
 
     def _notify(self, key, new_value, old_value, observers):
         """Invoke observer callbacks outside the lock."""
@@ -6,8 +6,19 @@
 # coordinates that can be projected by ViewTransform.
 #
 # Zero Tkinter dependencies. Zero CNC.vars direct access.
+#
+# The small rectangle/axes generators are memoized: they are pure
+# functions of a few scalars and are called with the same arguments
+# on every redraw. They return immutable tuples (shared between
+# callers), so copy before mutating.
 
 import math
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from ViewTransform import VIEW_XY
 
 
 def generate_grid_lines(axis_xmin, axis_xmax, axis_ymin, axis_ymax,
@@ -22,36 +33,44 @@ def generate_grid_lines(axis_xmin, axis_xmax, axis_ymin, axis_ymax,
         spacing: Grid spacing (default 10 units).
 
     Returns:
-        List of line segments, each as [(x1,y1,z), (x2,y2,z)].
+        ndarray of shape (N, 2, 3): one [(x1,y1,z), (x2,y2,z)] segment
+        per row, horizontal lines first, then vertical lines.
     """
     if spacing <= 0:
-        return []
+        return np.empty((0, 2, 3))
+
+    # Grid cell indices of the margin bounds, computed once
+    ix0 = axis_xmin // spacing
+    ix1 = axis_xmax // spacing
+    iy0 = axis_ymin // spacing
+    iy1 = axis_ymax // spacing
+
+    xmin = ix0 * spacing
+    xmax = (ix1 + 1) * spacing
+    ymin = iy0 * spacing
+    ymax = (iy1 + 1) * spacing
+
+    ys = np.arange(int(iy0), int(iy1) + 2) * spacing
+    xs = np.arange(int(ix0), int(ix1) + 2) * spacing
 
-    lines = []
-    xmin = (axis_xmin // spacing) * spacing
-    xmax = (axis_xmax // spacing + 1) * spacing
-    ymin = (axis_ymin // spacing) * spacing
-    ymax = (axis_ymax // spacing + 1) * spacing
+    lines = np.zeros((len(ys) + len(xs), 2, 3))
 
     # Horizontal lines
-    i = int(axis_ymin // spacing)
-    end = int(axis_ymax // spacing) + 2
-    while i < end:
-        y = i * spacing
-        lines.append([(xmin, y, 0.0), (xmax, y, 0.0)])
-        i += 1
+    horiz = lines[:len(ys)]
+    horiz[:, 0, 0] = xmin
+    horiz[:, 1, 0] = xmax
+    horiz[:, :, 1] = ys[:, None]
 
     # Vertical lines
-    i = int(axis_xmin // spacing)
-    end = int(axis_xmax // spacing) + 2
-    while i < end:
-        x = i * spacing
-        lines.append([(x, ymin, 0.0), (x, ymax, 0.0)])
-        i += 1
+    vert = lines[len(ys):]
+    vert[:, :, 0] = xs[:, None]
+    vert[:, 0, 1] = ymin
+    vert[:, 1, 1] = ymax
 
     return lines
 
 
+@lru_cache(maxsize=64)
 def generate_margin_rect(xmin, ymin, xmax, ymax):
     """Generate a closed rectangle path for a margin boundary.
 
@@ -59,18 +78,18 @@ def generate_margin_rect(xmin, ymin, xmax, ymax):
         xmin, ymin, xmax, ymax: Boundary coordinates.
 
     Returns:
-        List of 5 xyz tuples forming a closed rectangle,
-        or None if coordinates are invalid.
+        Tuple of 5 xyz tuples forming a closed rectangle.
     """
-    return [
+    return (
         (xmin, ymin, 0.0),
         (xmax, ymin, 0.0),
         (xmax, ymax, 0.0),
         (xmin, ymax, 0.0),
         (xmin, ymin, 0.0),
-    ]
+    )
 
 
+@lru_cache(maxsize=64)
 def generate_workarea_rect(work_offset_x, work_offset_y,
                            travel_x, travel_y):
     """Generate the workarea rectangle.
@@ -85,7 +104,7 @@ def generate_workarea_rect(work_offset_x, work_offset_y,
         travel_y: Machine Y travel distance.
 
     Returns:
-        List of 5 xyz tuples forming a closed rectangle.
+        Tuple of 5 xyz tuples forming a closed rectangle.
     """
     xmin = work_offset_x - travel_x
     ymin = work_offset_y - travel_y
@@ -94,6 +113,7 @@ def generate_workarea_rect(work_offset_x, work_offset_y,
     return generate_margin_rect(xmin, ymin, xmax, ymax)
 
 
+@lru_cache(maxsize=64)
 def generate_axes(scale):
     """Generate coordinate axis arrow endpoints.
 
@@ -101,15 +121,15 @@ def generate_axes(scale):
         scale: Length of each axis arrow.
 
     Returns:
-        Dict with keys "x", "y", "z", each mapping to a list
-        of two xyz tuples (origin to arrow tip).
+        Read-only mapping with keys "x", "y", "z", each mapping to a
+        tuple of two xyz tuples (origin to arrow tip).
     """
     origin = (0.0, 0.0, 0.0)
-    return {
-        "x": [origin, (scale, 0.0, 0.0)],
-        "y": [origin, (0.0, scale, 0.0)],
-        "z": [origin, (0.0, 0.0, scale)],
-    }
+    return MappingProxyType({
+        "x": (origin, (scale, 0.0, 0.0)),
+        "y": (origin, (0.0, scale, 0.0)),
+        "z": (origin, (0.0, 0.0, scale)),
+    })
 
 
 def generate_orient_crosshair(x, y, size):
@@ -148,6 +168,7 @@ def path_segments_to_xyz(path, z=0.0):
     return xyz
 
 
+@lru_cache(maxsize=64)
 def rect_to_xyz(xmin, ymin, xmax, ymax, z=0.0):
     """Convert rectangle bounds to a closed xyz path.
 
@@ -158,15 +179,15 @@ def rect_to_xyz(xmin, ymin, xmax, ymax, z=0.0):
         z: Z coordinate.
 
     Returns:
-        List of 5 (x, y, z) tuples.
+        Tuple of 5 (x, y, z) tuples.
     """
-    return [
+    return (
         (xmin, ymin, z),
         (xmax, ymin, z),
         (xmax, ymax, z),
         (xmin, ymax, z),
         (xmin, ymin, z),
-    ]
+    )
 
 
 def compute_gantry_geometry(diameter, zoom, view_type):
@@ -187,7 +208,6 @@ def compute_gantry_geometry(diameter, zoom, view_type):
             "is_top_view": bool # True for XY view
         }
     """
-    from ViewTransform import VIEW_XY
     gr = max(3, int(diameter / 2.0 * zoom))
     return {
         "radius": gr,
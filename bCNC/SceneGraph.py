@@ -12,12 +12,29 @@
 #   2. A Renderer takes the Scene and creates toolkit-specific items
 #   3. On redraw, the scene is rebuilt and re-rendered
 
+import array
+import bisect
+
+import numpy as np
+
+# Canvas pixels are integers; line-store coords are quantized to this
+_COORD_DTYPE = np.int16
+_COORD_MIN = np.iinfo(_COORD_DTYPE).min
+_COORD_MAX = np.iinfo(_COORD_DTYPE).max
+
 
 class LinePrimitive:
-    """A polyline or line segment."""
+    """A polyline or line segment.
+
+    The rarely used dash/arrow/cap styles and the metadata dict share
+    one ``_extras`` slot (None when all four are unset) to keep
+    per-line memory small. Scene.set_metadata() can attach renderer
+    data to any primitive without touching the primitive itself.
+    """
+
+    __slots__ = ("coords", "fill", "width", "tag", "item_id", "_extras")
 
-    __slots__ = ("coords", "fill", "width", "dash", "arrow",
-                 "cap", "tag", "item_id", "metadata")
+    _NO_EXTRAS = (None, None, None, None)
 
     def __init__(self, coords, fill="black", width=1, dash=None,
                  arrow=None, cap=None, tag=None, metadata=None):
@@ -35,12 +52,29 @@ class LinePrimitive:
         self.coords = coords
         self.fill = fill
         self.width = width
-        self.dash = dash
-        self.arrow = arrow
-        self.cap = cap
         self.tag = tag
         self.item_id = None
-        self.metadata = metadata
+        extras = (dash, arrow, cap, metadata)
+        self._extras = None if extras == self._NO_EXTRAS else extras
+
+    def _get_extra(self, idx):
+        extras = self._extras
+        return None if extras is None else extras[idx]
+
+    def _set_extra(self, idx, value):
+        extras = list(self._extras or self._NO_EXTRAS)
+        extras[idx] = value
+        extras = tuple(extras)
+        self._extras = None if extras == self._NO_EXTRAS else extras
+
+    dash = property(lambda self: self._get_extra(0),
+                    lambda self, v: self._set_extra(0, v))
+    arrow = property(lambda self: self._get_extra(1),
+                     lambda self, v: self._set_extra(1, v))
+    cap = property(lambda self: self._get_extra(2),
+                   lambda self, v: self._set_extra(2, v))
+    metadata = property(lambda self: self._get_extra(3),
+                        lambda self, v: self._set_extra(3, v))
 
 
 class OvalPrimitive:
@@ -112,22 +146,105 @@ class SceneLayer:
     """A named layer of drawing primitives with z-ordering.
 
     Layers are drawn back-to-front by z_order value.
+
+    Besides the generic primitive list, a layer keeps plain lines in
+    struct-of-arrays form (see add_line): one int16 (N, 2) pixel
+    array per line plus compact per-line style indices into a small
+    palette. Bulk
+    toolpath segments should use that store instead of allocating a
+    LinePrimitive each.
     """
 
-    __slots__ = ("name", "z_order", "visible", "primitives")
+    __slots__ = ("name", "z_order", "visible", "primitives", "version",
+                 "line_coords", "line_fill", "line_width", "line_dash",
+                 "line_tag", "_palette", "_palette_index")
 
     def __init__(self, name, z_order=0, visible=True):
         self.name = name
         self.z_order = z_order
         self.visible = visible
         self.primitives = []
+        self.version = 0    # bumped by add()/clear(), see Scene.flatten
+        self.line_coords = []
+        self.line_fill = array.array("H")   # palette index
+        self.line_width = array.array("f")
+        self.line_dash = array.array("H")   # palette index
+        self.line_tag = array.array("H")    # palette index
+        self._palette = []
+        self._palette_index = {}
 
     def add(self, primitive):
         self.primitives.append(primitive)
+        self.version += 1
         return primitive
 
+    def add_line(self, coords, fill="black", width=1, dash=None, tag=None):
+        """Append a line to the struct-of-arrays line store.
+
+        Coordinates are rounded to whole pixels and stored as an int16
+        (N, 2) array; values outside the int16 range are clamped.
+
+        Args:
+            coords: (x, y) canvas-space coordinate pairs (list or array).
+            fill: Line color string.
+            width: Line width in pixels.
+            dash: Dash pattern tuple or None for solid.
+            tag: String tag for grouping.
+
+        Returns:
+            Index of the line within this layer's line store.
+        """
+        pixels = np.rint(np.clip(
+            np.asarray(coords, dtype=float).reshape(-1, 2),
+            _COORD_MIN, _COORD_MAX)).astype(_COORD_DTYPE)
+        self.line_coords.append(pixels)
+        self.line_fill.append(self._intern(fill))
+        self.line_width.append(width)
+        self.line_dash.append(self._intern(dash))
+        self.line_tag.append(self._intern(tag))
+        return len(self.line_coords) - 1
+
+    def line_count(self):
+        return len(self.line_coords)
+
+    def line_batches(self):
+        """Group stored lines by style for batched rendering.
+
+        Returns:
+            Dict {(fill, width, dash): [int16 coords array, ...]} in
+            insertion order.
+        """
+        palette = self._palette
+        batches = {}
+        for coords, fill, width, dash in zip(
+                self.line_coords, self.line_fill,
+                self.line_width, self.line_dash):
+            key = (palette[fill], width, palette[dash])
+            batch = batches.get(key)
+            if batch is None:
+                batches[key] = batch = []
+            batch.append(coords)
+        return batches
+
+    def _intern(self, value):
+        """Return the palette index for a style value, adding it if new."""
+        idx = self._palette_index.get(value)
+        if idx is None:
+            idx = len(self._palette)
+            self._palette.append(value)
+            self._palette_index[value] = idx
+        return idx
+
     def clear(self):
         self.primitives.clear()
+        self.version += 1
+        self.line_coords.clear()
+        del self.line_fill[:]
+        del self.line_width[:]
+        del self.line_dash[:]
+        del self.line_tag[:]
+        self._palette.clear()
+        self._palette_index.clear()
 
 
 class Scene:
@@ -141,6 +258,9 @@ class Scene:
     def __init__(self):
         self._layers = {}
         self._order = []
+        self._order_keys = []  # z_order of each entry in _order
+        self._metadata = {}    # id(primitive) -> (primitive, dict)
+        self._flat = None      # (state key, list) cached by flatten()
 
     def layer(self, name, z_order=0):
         """Get or create a named layer.
@@ -155,8 +275,11 @@ class Scene:
         if name not in self._layers:
             lyr = SceneLayer(name, z_order)
             self._layers[name] = lyr
-            self._order = sorted(
-                self._layers.values(), key=lambda l: l.z_order)
+            # bisect_right keeps insertion order among equal z_orders,
+            # same as the stable sort it replaces
+            idx = bisect.bisect_right(self._order_keys, z_order)
+            self._order_keys.insert(idx, z_order)
+            self._order.insert(idx, lyr)
         return self._layers[name]
 
     def clear(self, layer_name=None):
@@ -169,8 +292,29 @@ class Scene:
         if layer_name is None:
             for lyr in self._layers.values():
                 lyr.clear()
+            self._metadata.clear()
         elif layer_name in self._layers:
-            self._layers[layer_name].clear()
+            lyr = self._layers[layer_name]
+            for prim in lyr.primitives:
+                self._metadata.pop(id(prim), None)
+            lyr.clear()
+
+    def set_metadata(self, primitive, data):
+        """Attach renderer-specific data to a primitive.
+
+        Args:
+            primitive: Any primitive in this scene.
+            data: Dict of renderer data, or None to remove it.
+        """
+        if data is None:
+            self._metadata.pop(id(primitive), None)
+        else:
+            self._metadata[id(primitive)] = (primitive, data)
+
+    def get_metadata(self, primitive):
+        """Return the data attached with set_metadata(), or None."""
+        entry = self._metadata.get(id(primitive))
+        return None if entry is None else entry[1]
 
     def layers_ordered(self):
         """Return layers sorted by z_order (back to front).
@@ -180,6 +324,25 @@ class Scene:
         """
         return self._order
 
+    def flatten(self):
+        """Return all primitives of visible layers as one flat list.
+
+        The list is cached and rebuilt only when a layer was added,
+        changed through SceneLayer.add()/clear(), or toggled visible.
+        Renderers should use this rather than all_primitives() and
+        must not mutate the returned list.
+
+        Returns:
+            List of drawing primitives in z_order.
+        """
+        key = tuple((lyr.version, lyr.visible) for lyr in self._order)
+        flat = self._flat
+        if flat is None or flat[0] != key:
+            prims = [p for lyr in self._order if lyr.visible
+                     for p in lyr.primitives]
+            flat = self._flat = (key, prims)
+        return flat[1]
+
     def all_primitives(self):
         """Iterate over all primitives across all visible layers.
 
@@ -415,9 +415,10 @@ class Sender:
     # ----------------------------------------------------------------------
     # Load a file into editor
     # ----------------------------------------------------------------------
-    def load(self, filename):
-        fn, ext = os.path.splitext(filename)
-        ext = ext.lower()
+    def load(self, filename, ext=None):
+        # ext: lowercase extension if the caller already split it
+        if ext is None:
+            ext = os.path.splitext(filename)[1].lower()
         if ext == ".probe":
             if filename is not None:
                 self.gcode.probe.filename = filename
@@ -6,8 +6,12 @@
 #
 # Zero Tkinter dependencies. Can be used by any rendering backend.
 
+import functools
+import itertools
 import math
 
+import numpy as np
+
 # View constants
 VIEW_XY = 0
 VIEW_XZ = 1
@@ -25,55 +29,176 @@ C60 = math.cos(math.radians(60))
 MAXDIST = 10000
 
 
-def project_3d_to_2d(xyz, view, zoom):
+def _matrix(rows):
+    m = np.array(rows, dtype=np.float64)
+    m.setflags(write=False)
+    return m
+
+
+# (3, 2) projection matrices: [x y z] @ M -> [cx cy] (before zoom).
+# Rows are the screen contribution of world x, y and z; screen Y is
+# flipped, hence the negative signs.
+_M_XY = _matrix([[1.0, 0.0], [0.0, -1.0], [0.0, 0.0]])
+# Indexed by view id (VIEW_XY .. VIEW_ISO3)
+_PROJ_MATRICES = (
+    _M_XY,
+    _matrix([[1.0, 0.0], [0.0, 0.0], [0.0, -1.0]]),
+    _matrix([[0.0, 0.0], [1.0, 0.0], [0.0, -1.0]]),
+    _matrix([[S60, C60], [S60, -C60], [0.0, -1.0]]),
+    _matrix([[S60, -C60], [-S60, -C60], [0.0, -1.0]]),
+    _matrix([[-S60, -C60], [-S60, C60], [0.0, -1.0]]),
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _scaled_matrix(view, zoom, dtype=np.float64):
+    """Projection matrix for view with zoom folded in (read-only).
+
+    Zoom only changes on user interaction, so nearly every projection
+    between two zoom steps is a cache hit.
+    """
+    if view not in range(len(_PROJ_MATRICES)):
+        view = VIEW_XY
+    m = (_PROJ_MATRICES[view] * zoom).astype(dtype)
+    m.setflags(write=False)
+    return m
+
+
+# The same matrices as plain float tuples, for the small-input path
+_PROJ_COEFFS = {
+    view: tuple(tuple(row) for row in m.tolist())
+    for view, m in enumerate(_PROJ_MATRICES)
+}
+
+# Below this many points a list input is projected with scalar Python
+# arithmetic: NumPy's fixed per-call overhead dominates for the 2-point
+# lines and short arcs that make up most G-code moves.
+_SMALL_INPUT = 8
+
+
+def _project_small(xyz, view, zoom):
+    """Scalar projection + clamp of a short point list."""
+    (ax, ay), (bx, by), (cx, cy) = _PROJ_COEFFS.get(
+        view, _PROJ_COEFFS[VIEW_XY])
+    ax *= zoom
+    ay *= zoom
+    bx *= zoom
+    by *= zoom
+    cx *= zoom
+    cy *= zoom
+    md = MAXDIST
+    # Preallocated flat buffer: no per-point tuple, no list growth
+    flat = [0.0] * (2 * len(xyz))
+    i = 0
+    for x, y, z in xyz:
+        px = x * ax + y * bx + z * cx
+        py = x * ay + y * by + z * cy
+        if px < -md or px > md:
+            px = -md if px < 0 else md
+        if py < -md or py > md:
+            py = -md if py < 0 else md
+        flat[i] = px
+        flat[i + 1] = py
+        i += 2
+    return np.array(flat, dtype=np.float64).reshape(-1, 2)
+
+
+def project_3d_to_2d(xyz, view, zoom, viewport_bbox=None, out=None):
     """Project a list of 3D world points to 2D canvas coordinates.
 
     This is the core transformation: world (x, y, z) -> screen (cx, cy).
     Note: the Y-axis is flipped (negated) for screen coordinates.
 
     Args:
-        xyz: List of (x, y, z) tuples in world space.
+        xyz: Sequence of (x, y, z) points in world space, or an
+             (N, 3) array.
         view: View mode (VIEW_XY, VIEW_XZ, etc.).
         zoom: Current zoom factor.
+        viewport_bbox: Optional (xmin, ymin, xmax, ymax) visible area
+             in canvas coordinates. When given, point sets whose
+             bounding box projects entirely outside it are culled
+             (an empty array is returned), and the clamp is skipped
+             when the projected box is already within MAXDIST.
+        out: Optional preallocated (N, 2) array of the result dtype
+             to write into instead of allocating.
 
     Returns:
-        List of (cx, cy) tuples in canvas space.
+        (N, 2) ndarray of (cx, cy) rows in canvas space. float32
+        (N, 3) array input stays float32 end to end; anything else
+        gives float64. Use len() rather than truth-testing to check
+        for points.
     """
-    if view == VIEW_XY:
-        coords = [(p[0] * zoom, -p[1] * zoom) for p in xyz]
-    elif view == VIEW_XZ:
-        coords = [(p[0] * zoom, -p[2] * zoom) for p in xyz]
-    elif view == VIEW_YZ:
-        coords = [(p[1] * zoom, -p[2] * zoom) for p in xyz]
-    elif view == VIEW_ISO1:
-        coords = [
-            (
-                (p[0] * S60 + p[1] * S60) * zoom,
-                (+p[0] * C60 - p[1] * C60 - p[2]) * zoom,
-            )
-            for p in xyz
-        ]
-    elif view == VIEW_ISO2:
-        coords = [
-            (
-                (p[0] * S60 - p[1] * S60) * zoom,
-                (-p[0] * C60 - p[1] * C60 - p[2]) * zoom,
-            )
-            for p in xyz
-        ]
-    elif view == VIEW_ISO3:
-        coords = [
-            (
-                (-p[0] * S60 - p[1] * S60) * zoom,
-                (-p[0] * C60 + p[1] * C60 - p[2]) * zoom,
-            )
-            for p in xyz
-        ]
+    if isinstance(xyz, np.ndarray):
+        # Any layout is fine for matmul, so ndarrays are never copied
+        dtype = np.float32 if xyz.dtype == np.float32 else np.float64
+        xyz = xyz.astype(dtype, copy=False).reshape(-1, 3)
+    elif viewport_bbox is None and out is None and len(xyz) <= _SMALL_INPUT:
+        return _project_small(xyz, view, zoom)
     else:
-        coords = [(p[0] * zoom, -p[1] * zoom) for p in xyz]
+        dtype = np.float64
+        xyz = np.asarray(xyz, dtype=dtype).reshape(-1, 3)
+    # Zoom is folded into the tiny (3, 2) matrix so the product writes
+    # final coordinates in one pass; the clamp then works in place
+    matrix = _scaled_matrix(view, zoom, dtype)
+
+    if viewport_bbox is not None and len(xyz):
+        # Project the 8 corners of the world-space AABB
+        corners = np.array(list(itertools.product(
+            *zip(xyz.min(axis=0), xyz.max(axis=0))))) @ matrix
+        cxmin, cymin = corners.min(axis=0)
+        cxmax, cymax = corners.max(axis=0)
+        vxmin, vymin, vxmax, vymax = viewport_bbox
+        if (cxmax < vxmin or cxmin > vxmax
+                or cymax < vymin or cymin > vymax):
+            return np.empty((0, 2), dtype=dtype)
+        if (-MAXDIST <= cxmin and cxmax <= MAXDIST
+                and -MAXDIST <= cymin and cymax <= MAXDIST):
+            return np.matmul(xyz, matrix, out=out)
+
+    coords = np.matmul(xyz, matrix, out=out)
 
     # Clamp to prevent excessively large coordinates
-    return _clamp_coords(coords)
+    return np.clip(coords, -MAXDIST, MAXDIST, out=coords)
+
+
+def project_point_3d_to_2d(x, y, z, view, zoom):
+    """Project a single world point; scalar math, no list or array.
+
+    Returns:
+        Clamped (cx, cy) float tuple in canvas space.
+    """
+    (ax, ay), (bx, by), (cx, cy) = _PROJ_COEFFS.get(
+        view, _PROJ_COEFFS[VIEW_XY])
+    px = (x * ax + y * bx + z * cx) * zoom
+    py = (x * ay + y * by + z * cy) * zoom
+    md = MAXDIST
+    if px < -md or px > md:
+        px = -md if px < 0 else md
+    if py < -md or py > md:
+        py = -md if py < 0 else md
+    return px, py
+
+
+# World axes each view can address from the canvas (index into x, y, z);
+# the remaining axis is unknown and left out of the inverse
+_UNPROJECT_AXES = ((0, 1), (0, 2), (1, 2), (0, 1), (0, 1), (0, 1))
+
+
+@functools.lru_cache(maxsize=16)
+def _unproject_coeffs(view, zoom):
+    """Inverse of _scaled_matrix as (a, b, kau, kav, kbu, kbv) floats.
+
+    world[a] = cx * kau + cy * kav and world[b] = cx * kbu + cy * kbv
+    for the two addressable axes a, b. It is derived from the forward
+    matrix once per (view, zoom), so the per-call work is four
+    multiply-adds.
+    """
+    if view not in range(len(_PROJ_MATRICES)):
+        view = VIEW_XY
+    axes = _UNPROJECT_AXES[view]
+    inv = np.linalg.inv(_PROJ_MATRICES[view][list(axes)]) * (1.0 / zoom)
+    (kau, kbu), (kav, kbv) = inv.tolist()
+    return axes + (kau, kav, kbu, kbv)
 
 
 def unproject_2d_to_3d(cx, cy, view, zoom):
@@ -94,43 +219,11 @@ def unproject_2d_to_3d(cx, cy, view, zoom):
     """
     if zoom == 0:
         zoom = 0.001
-
-    if view == VIEW_XY:
-        x = cx / zoom
-        y = -cy / zoom
-        z = 0.0
-
-    elif view == VIEW_XZ:
-        x = cx / zoom
-        y = 0.0
-        z = -cy / zoom
-
-    elif view == VIEW_YZ:
-        x = 0.0
-        y = cx / zoom
-        z = -cy / zoom
-
-    elif view == VIEW_ISO1:
-        x = (cx / S60 + cy / C60) / zoom / 2
-        y = (cx / S60 - cy / C60) / zoom / 2
-        z = 0.0
-
-    elif view == VIEW_ISO2:
-        x = (cx / S60 - cy / C60) / zoom / 2
-        y = -(cx / S60 + cy / C60) / zoom / 2
-        z = 0.0
-
-    elif view == VIEW_ISO3:
-        x = -(cx / S60 + cy / C60) / zoom / 2
-        y = -(cx / S60 - cy / C60) / zoom / 2
-        z = 0.0
-
-    else:
-        x = cx / zoom
-        y = -cy / zoom
-        z = 0.0
-
-    return x, y, z
+    a, b, kau, kav, kbu, kbv = _unproject_coeffs(view, zoom)
+    xyz = [0.0, 0.0, 0.0]
+    xyz[a] = cx * kau + cy * kav
+    xyz[b] = cx * kbu + cy * kbv
+    return tuple(xyz)
 
 
 def canvas_to_machine(cx, cy, view, zoom):
@@ -150,40 +243,11 @@ def canvas_to_machine(cx, cy, view, zoom):
         Tuple (u, v, w) where None indicates an axis not
         addressable in this view.
     """
-    u = cx / zoom
-    v = cy / zoom
-
-    if view == VIEW_XY:
-        return u, -v, None
-
-    elif view == VIEW_XZ:
-        return u, None, -v
-
-    elif view == VIEW_YZ:
-        return None, u, -v
-
-    elif view == VIEW_ISO1:
-        return (
-            0.5 * (u / S60 + v / C60),
-            0.5 * (u / S60 - v / C60),
-            None,
-        )
-
-    elif view == VIEW_ISO2:
-        return (
-            0.5 * (u / S60 - v / C60),
-            -0.5 * (u / S60 + v / C60),
-            None,
-        )
-
-    elif view == VIEW_ISO3:
-        return (
-            -0.5 * (u / S60 + v / C60),
-            -0.5 * (u / S60 - v / C60),
-            None,
-        )
-
-    return u, -v, None
+    a, b, kau, kav, kbu, kbv = _unproject_coeffs(view, zoom)
+    uvw = [None, None, None]
+    uvw[a] = cx * kau + cy * kav
+    uvw[b] = cx * kbu + cy * kbv
+    return tuple(uvw)
 
 
 def compute_zoom_transform(old_zoom, zoom_factor, pin_x, pin_y,
@@ -231,15 +295,8 @@ def compute_fit_zoom(bbox_width, bbox_height,
     if bbox_width <= 0 or bbox_height <= 0:
         return None
 
-    try:
-        zx = round(float(viewport_width / bbox_width), 2)
-    except Exception:
-        return None
-
-    try:
-        zy = round(float(viewport_height / bbox_height), 2)
-    except Exception:
-        return None
+    zx = round(viewport_width / bbox_width, 2)
+    zy = round(viewport_height / bbox_height, 2)
 
     if zx > 0.98:
         return min(zx, zy)
@@ -247,6 +304,12 @@ def compute_fit_zoom(bbox_width, bbox_height,
         return max(zx, zy)
 
 
+# Every power of ten int(log10(d)) can yield for a finite positive
+# double, so compute_axis_scale needs no pow() call
+_POW10_MIN = -323
+_POW10 = tuple(math.pow(10.0, i) for i in range(_POW10_MIN, 309))
+
+
 def compute_axis_scale(axis_min, axis_max, is_inch=False):
     """Compute a nice scale length for drawing axes.
 
@@ -260,17 +323,6 @@ def compute_axis_scale(axis_min, axis_max, is_inch=False):
     """
     d = axis_max - axis_min
     try:
-        return math.pow(10.0, int(math.log10(d)))
+        return _POW10[int(math.log10(d)) - _POW10_MIN]
     except Exception:
         return 10.0 if is_inch else 100.0
-
-
-def _clamp_coords(coords):
-    """Clamp coordinates to prevent excessively large values."""
-    result = []
-    for x, y in coords:
-        if abs(x) > MAXDIST or abs(y) > MAXDIST:
-            x = max(-MAXDIST, min(MAXDIST, x))
-            y = max(-MAXDIST, min(MAXDIST, y))
-        result.append((x, y))
-    return result
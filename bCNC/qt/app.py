@@ -17,20 +17,19 @@ if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
 else:
     _bCNC_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-# Ensure bCNC package is on the path
-if _bCNC_dir not in sys.path:
-    sys.path.insert(0, _bCNC_dir)
-# Also add lib/ for tkExtra, rexx, etc.
-_lib_dir = os.path.join(_bCNC_dir, "lib")
-if _lib_dir not in sys.path:
-    sys.path.insert(0, _lib_dir)
-# Also add controllers/ and plugins/
-_ctrl_dir = os.path.join(_bCNC_dir, "controllers")
-if _ctrl_dir not in sys.path:
-    sys.path.insert(0, _ctrl_dir)
-_plug_dir = os.path.join(_bCNC_dir, "plugins")
-if _plug_dir not in sys.path:
-    sys.path.insert(0, _plug_dir)
+# Put plugins/, controllers/, lib/ (tkExtra, rexx, etc.) and the bCNC
+# package itself on the path, in that order, with one splice
+_on_path = set(sys.path)
+sys.path[:0] = [
+    d for d in (
+        os.path.join(_bCNC_dir, "plugins"),
+        os.path.join(_bCNC_dir, "controllers"),
+        os.path.join(_bCNC_dir, "lib"),
+        _bCNC_dir,
+    )
+    if d not in _on_path
+]
+del _on_path
 
 # Install _() translation builtin before any other bCNC imports
 # (Helpers.py does gettext.install() which puts _() in builtins)
@@ -39,17 +38,15 @@ import Helpers  # noqa: F401
 import utils_core as Utils
 Utils.loadConfiguration()
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-
-from CNC import CNC
-from Sender import Sender
-
-from .main_window import MainWindow
-
 
 def main():
     """Create the QApplication, Sender, and MainWindow, then run."""
+    # Heavy imports are deferred so importing this module stays cheap
+    from PySide6.QtWidgets import QApplication
+
+    from Sender import Sender
+
+    from .main_window import MainWindow
 
     app = QApplication(sys.argv)
     app.setApplicationName("bCNC")
@@ -64,15 +61,17 @@ def main():
     window.show()
 
     # Load file from command line if provided
-    args = [a for a in sys.argv[1:] if not a.startswith("-")]
-    if args and os.path.isfile(args[0]):
-        sender.load(args[0])
-        Utils.addRecent(args[0])
-        window.signals.file_loaded.emit(args[0])
+    filename = next(
+        (a for a in sys.argv[1:] if not a.startswith("-")), None)
+    loaded = filename is not None and os.path.isfile(filename)
+    if loaded:
+        sender.load(filename)
+        Utils.addRecent(filename)
+        window.signals.file_loaded.emit(filename)
 
     # Initial draw and select all blocks (highlights paths like Tkinter)
     window._on_draw()
-    if args and os.path.isfile(args[0]):
+    if loaded:
         window.editor_panel.select_all()
     window._update_title()
 
@@ -3,7 +3,7 @@
 # Lives inside ProbePanel's QTabWidget.  Probe settings (feed, TLO, cmd)
 # are managed by ProbeCommonWidget and accessed via set_probe_common().
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QGridLayout,
     QGroupBox, QLabel, QPushButton, QDoubleSpinBox,
@@ -26,6 +26,12 @@ class AutolevelTab(QWidget):
         self.signals = signals
         self._probe_common = None
 
+        # Coalesce bursts of spinbox edits into one step recalculation
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self._update_steps)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
 
@@ -160,8 +166,8 @@ class AutolevelTab(QWidget):
         self.y_max.setValue(Utils.getFloat("Probe", "ymax", 10.0))
         self.z_min.setValue(Utils.getFloat("Probe", "zmin", -10.0))
         self.z_max.setValue(Utils.getFloat("Probe", "zmax", 3.0))
-        self.x_n.setValue(max(2, Utils.getInt("Probe", "xn", 5)))
-        self.y_n.setValue(max(2, Utils.getInt("Probe", "yn", 5)))
+        self.x_n.setValue(Utils.getInt("Probe", "xn", 5))
+        self.y_n.setValue(Utils.getInt("Probe", "yn", 5))
 
         self._update_steps()
 
@@ -192,7 +198,7 @@ class AutolevelTab(QWidget):
         try:
             probe.xmin = self.x_min.value()
             probe.xmax = self.x_max.value()
-            probe.xn = max(2, self.x_n.value())
+            probe.xn = self.x_n.value()
             probe.xstep()
         except Exception:
             return "Invalid X probing region"
@@ -203,7 +209,7 @@ class AutolevelTab(QWidget):
         try:
             probe.ymin = self.y_min.value()
             probe.ymax = self.y_max.value()
-            probe.yn = max(2, self.y_n.value())
+            probe.yn = self.y_n.value()
             probe.ystep()
         except Exception:
             return "Invalid Y probing region"
@@ -226,14 +232,14 @@ class AutolevelTab(QWidget):
         """Recalculate and display step sizes."""
         try:
             xrange = self.x_max.value() - self.x_min.value()
-            xn = max(2, self.x_n.value())
+            xn = self.x_n.value()
             self.x_step.setText(f"{xrange / (xn - 1):.5g}")
         except Exception:
             self.x_step.setText("")
 
         try:
             yrange = self.y_max.value() - self.y_min.value()
-            yn = max(2, self.y_n.value())
+            yn = self.y_n.value()
             self.y_step.setText(f"{yrange / (yn - 1):.5g}")
         except Exception:
             self.y_step.setText("")
@@ -242,7 +248,7 @@ class AutolevelTab(QWidget):
     # Slot handlers
     # ------------------------------------------------------------------
     def _on_grid_changed(self):
-        self._update_steps()
+        self._recalc_timer.start()
 
     def _on_get_margins(self):
         self.x_min.setValue(CNC.vars.get("xmin", 0.0))
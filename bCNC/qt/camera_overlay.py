@@ -1,12 +1,14 @@
 # Qt Camera Overlay — live video feed on QGraphicsScene
 #
-# Manages Camera instance, QTimer refresh, scene items (pixmap,
+# Manages Camera instance, frame grab thread, scene items (pixmap,
 # crosshair lines, circles), and anchor-based positioning.
 
-from PySide6.QtCore import Qt, QTimer, QPoint
+from PySide6.QtCore import Qt, QThread, QTimer, QPoint, Signal
+from PySide6.QtGui import QImage
 from PySide6.QtGui import QColor, QPen, QPixmap
 from PySide6.QtWidgets import (
     QGraphicsPixmapItem, QGraphicsLineItem, QGraphicsEllipseItem,
+    QGraphicsItemGroup,
 )
 
 import Camera
@@ -39,14 +41,81 @@ CAMERA_LOCATION_ORDER = [
     "Bottom-Right",
 ]
 
+# Viewport anchor -> (kx, sx, ky, sy): the overlay center sits at
+# (kx * viewport_w + sx * pixmap_w / 2, ky * viewport_h + sy * pixmap_h / 2)
+_ANCHOR_VIEWPORT = {
+    "nw": (0.0, 1.0, 0.0, 1.0),
+    "n": (0.5, 0.0, 0.0, 1.0),
+    "ne": (1.0, -1.0, 0.0, 1.0),
+    "w": (0.0, 1.0, 0.5, 0.0),
+    "center": (0.5, 0.0, 0.5, 0.0),
+    "e": (1.0, -1.0, 0.5, 0.0),
+    "sw": (0.0, 1.0, 1.0, -1.0),
+    "s": (0.5, 0.0, 1.0, -1.0),
+    "se": (1.0, -1.0, 1.0, -1.0),
+}
+
 CAMERA_COLOR = QColor("cyan")
-REFRESH_MS = 100
+
+# Crosshair/circle pens, shared by every overlay item
+_PEN_SOLID = QPen(CAMERA_COLOR)
+_PEN_SOLID.setWidthF(1)
+_PEN_DASH = QPen(CAMERA_COLOR)
+_PEN_DASH.setWidthF(1)
+_PEN_DASH.setStyle(Qt.PenStyle.DashLine)
+
+
+class CameraGrabThread(QThread):
+    """Blocks on camera reads and pushes each processed frame to the GUI.
+
+    The capture paces the loop, so every frame is delivered once, as
+    soon as it arrives. Each frame is processed into the next of the
+    camera's Camera.FRAME_BANKS buffer sets, so the thread can prepare
+    a frame while the GUI still converts the previous one. Once every
+    bank holds a frame the GUI has not shown yet, new frames are still
+    read, so the capture never backs up, but are dropped unprocessed:
+    this bounds the queue and keeps the zero-copy QImages intact.
+
+    emitted is only written by this thread and shown only by the GUI
+    thread, so their difference is race-free without a lock; the same
+    holds for the edge_detect and resize_args settings. The counters
+    are never reset: frames queued before a pause or stop still arrive
+    and count as shown, so the difference always bounds the frames in
+    flight.
+    """
+
+    frame_ready = Signal(QImage)
+
+    def __init__(self, camera):
+        super().__init__()
+        self._camera = camera
+        self.edge_detect = False
+        self.resize_args = (1.0, 2000, 2000)  # (factor, max_w, max_h)
+        self.emitted = 0
+        self.shown = 0
+
+    def run(self):
+        camera = self._camera
+        while not self.isInterruptionRequested() and camera.isOn():
+            if not camera.read():
+                break
+            if self.emitted - self.shown >= Camera.FRAME_BANKS:
+                continue
+            camera.swapBuffers()
+            # Downscale first so edge detection sees fewer pixels
+            camera.resize(*self.resize_args)
+            if self.edge_detect:
+                camera.canny(50, 200)
+            qimg = camera.toQImage()
+            if qimg is not None:
+                self.emitted += 1
+                self.frame_ready.emit(qimg)
 
 
 class CameraOverlay:
     """Camera video overlay on the CNC canvas scene.
 
-    Owns a Camera instance, a QTimer for periodic refresh, and
+    Owns a Camera instance, a CameraGrabThread feeding it frames, and
     QGraphicsScene items for the video feed, crosshair, and circles.
     """
 
@@ -55,24 +124,41 @@ class CameraOverlay:
         self._view = view
         self._camera = Camera.Camera("aligncam")
 
-        self._timer = QTimer()
-        self._timer.timeout.connect(self._refresh)
+        # Resolved once instead of looked up on every frame
+        self._vp = view.viewport()
+        if hasattr(scene, 'zoom'):
+            self._get_zoom = lambda: scene.zoom
+        else:
+            self._get_zoom = lambda: 1.0
+
+        self._grab = CameraGrabThread(self._camera)
+        self._grab.frame_ready.connect(
+            self._refresh, Qt.ConnectionType.QueuedConnection)
 
         # Scene items (created on first frame)
+        self._group = None
         self._pixmap_item = None
+        self._pw = 0                # size of the pixmap shown
+        self._ph = 0
         self._hori_line = None
         self._vert_line = None
         self._inner_circle = None
         self._outer_circle = None
-
+        # Geometry last applied by _reposition()
+        self._last_shape = None
+        self._last_pos = None
         # Display properties
+        self._anchor = None
+        self._anchor_k = None
+        # Inputs and result of the last _compute_anchor_pos()
+        self._anchor_key = None
+        self._anchor_pos = None
         self.anchor = "center"
         self.rotation = 0.0
         self.x_center = 0.0
         self.y_center = 0.0
         self.scale = 10.0
         self.radius = 1.5875    # half of default 3.175mm diameter
-        self.edge_detect = False
         self.camera_dx = 0.0
         self.camera_dy = 0.0
         self.camera_z = 0.0
@@ -83,24 +169,63 @@ class CameraOverlay:
         self._gantry_wy = 0.0
         self._gantry_wz = 0.0
 
+    @property
+    def anchor(self):
+        return self._anchor
+
+    @anchor.setter
+    def anchor(self, anchor):
+        # Resolve the placement once here rather than on every frame
+        self._anchor = anchor
+        self._anchor_k = _ANCHOR_VIEWPORT.get(
+            anchor, _ANCHOR_VIEWPORT["center"])
+
+    @property
+    def edge_detect(self):
+        return self._grab.edge_detect
+
+    @edge_detect.setter
+    def edge_detect(self, enabled):
+        self._grab.edge_detect = enabled
+
     def start(self):
-        """Start camera capture and refresh timer.
+        """Start camera capture and the frame grab thread.
 
         Returns False if camera failed to open.
         """
         if not Camera.hasOpenCV():
             return False
+        self._camera.low_latency = True
         result = self._camera.start()
         if result is False:
             return False
-        self._timer.start(REFRESH_MS)
+        self._grab.resize_args = self._resize_args()
+        self._grab.start()
+        # A full frame repaints most of the viewport anyway; skip the
+        # per-item dirty region bookkeeping while the feed runs
+        self._view.set_full_update(True)
         return True
 
+    def pause(self):
+        """Stop grabbing frames while the canvas is hidden.
+
+        The camera stays open so resume() continues without the
+        (slow) device start-up.
+        """
+        self._grab.requestInterruption()
+        self._grab.wait()
+
+    def resume(self):
+        """Restart grabbing after pause(), if the camera is on."""
+        if self._camera.isOn() and not self._grab.isRunning():
+            self._grab.start()
+
     def stop(self):
-        """Stop refresh timer, remove scene items, stop camera."""
-        self._timer.stop()
+        """Stop the grab thread, remove scene items, stop camera."""
+        self.pause()
         self._remove_items()
         self._camera.stop()
+        self._view.set_full_update(False)
 
     def is_on(self):
         """Return True if camera is currently active."""
@@ -129,81 +254,82 @@ class CameraOverlay:
         self._camera.save(filename)
 
     # ------------------------------------------------------------------
-    # Timer callback
+    # Frame slot (GUI thread)
     # ------------------------------------------------------------------
-    def _refresh(self):
-        """Read a frame, optionally apply edge detection, and display."""
-        if not self._camera.isOn():
-            return
-
-        if not self._camera.read():
-            return
-
-        if self.edge_detect:
-            self._camera.canny(50, 200)
-
-        # Resize based on zoom and scale
-        zoom = self._scene.zoom if hasattr(self._scene, 'zoom') else 1.0
+    def _resize_args(self):
+        """Frame scaling for the current zoom, scale and viewport."""
+        zoom = self._get_zoom()
         factor = zoom / self.scale if self.scale > 0 else 1.0
-        vp = self._view.viewport()
+        vp = self._vp
         max_w = vp.width() if vp else 2000
         max_h = vp.height() if vp else 2000
-        self._camera.resize(factor, max_w, max_h)
+        return factor, max_w, max_h
 
-        # Convert to QImage → QPixmap
-        qimg = self._camera.toQImage()
-        if qimg is None:
+    def _refresh(self, qimg):
+        """Display a frame delivered by the grab thread."""
+        if not self._camera.isOn():
+            # Dropped, but its bank is free again
+            self._frame_shown()
             return
+
+        # Picked up by the grab thread for the next frame
+        self._grab.resize_args = self._resize_args()
+
         pixmap = QPixmap.fromImage(qimg)
 
         if self._pixmap_item is None:
             self._create_items(pixmap)
         else:
             self._pixmap_item.setPixmap(pixmap)
+        self._pw = pixmap.width()
+        self._ph = pixmap.height()
 
         self._reposition()
+        # Accept the next frame once this one has been painted
+        QTimer.singleShot(0, self._frame_shown)
+
+    def _frame_shown(self):
+        self._grab.shown += 1
 
     # ------------------------------------------------------------------
     # Scene item management
     # ------------------------------------------------------------------
     def _create_items(self, pixmap):
-        """Create scene items for camera overlay."""
-        # Video feed (Z=5, below crosshair)
-        self._pixmap_item = QGraphicsPixmapItem(pixmap)
-        self._pixmap_item.setZValue(5)
-        self._scene.addItem(self._pixmap_item)
+        """Create scene items for camera overlay.
 
-        # Crosshair and circles (Z=6, above video)
-        pen_solid = QPen(CAMERA_COLOR)
-        pen_solid.setWidthF(1)
+        All items share one group whose origin is the overlay center,
+        so following the anchor is a single setPos() on the group.
+        """
+        self._group = QGraphicsItemGroup()
+        self._group.setZValue(5)
+        self._scene.addItem(self._group)
+        self._last_shape = None
+        self._last_pos = None
 
-        pen_dash = QPen(CAMERA_COLOR)
-        pen_dash.setWidthF(1)
-        pen_dash.setStyle(Qt.PenStyle.DashLine)
+        # Video feed (below crosshair)
+        self._pixmap_item = QGraphicsPixmapItem(pixmap)
+        self._group.addToGroup(self._pixmap_item)
 
+        # Crosshair and circles (above video)
         self._hori_line = QGraphicsLineItem()
-        self._hori_line.setPen(pen_solid)
-        self._hori_line.setZValue(6)
-        self._scene.addItem(self._hori_line)
-
+        self._hori_line.setPen(_PEN_SOLID)
         self._vert_line = QGraphicsLineItem()
-        self._vert_line.setPen(pen_solid)
-        self._vert_line.setZValue(6)
-        self._scene.addItem(self._vert_line)
-
+        self._vert_line.setPen(_PEN_SOLID)
         self._inner_circle = QGraphicsEllipseItem()
-        self._inner_circle.setPen(pen_solid)
-        self._inner_circle.setZValue(6)
-        self._scene.addItem(self._inner_circle)
-
+        self._inner_circle.setPen(_PEN_SOLID)
         self._outer_circle = QGraphicsEllipseItem()
-        self._outer_circle.setPen(pen_dash)
-        self._outer_circle.setZValue(6)
-        self._scene.addItem(self._outer_circle)
+        self._outer_circle.setPen(_PEN_DASH)
+        for item in (self._hori_line, self._vert_line,
+                     self._inner_circle, self._outer_circle):
+            item.setZValue(1)
+            self._group.addToGroup(item)
 
     def reset_items(self):
         """Null out item references (call after scene.clear())."""
+        self._group = None
         self._pixmap_item = None
+        self._pw = 0
+        self._ph = 0
         self._hori_line = None
         self._vert_line = None
         self._inner_circle = None
@@ -211,15 +337,12 @@ class CameraOverlay:
 
     def _remove_items(self):
         """Remove all camera items from the scene."""
-        for attr in ('_pixmap_item', '_hori_line', '_vert_line',
-                      '_inner_circle', '_outer_circle'):
-            item = getattr(self, attr, None)
-            if item is not None:
-                try:
-                    self._scene.removeItem(item)
-                except RuntimeError:
-                    pass
-                setattr(self, attr, None)
+        if self._group is not None:
+            try:
+                self._scene.removeItem(self._group)
+            except RuntimeError:
+                pass
+        self.reset_items()
 
     # ------------------------------------------------------------------
     # Positioning
@@ -229,23 +352,15 @@ class CameraOverlay:
         if self._pixmap_item is None:
             return
 
-        pixmap = self._pixmap_item.pixmap()
-        pw = pixmap.width()
-        ph = pixmap.height()
+        pw = self._pw
+        ph = self._ph
         if pw == 0 or ph == 0:
             return
 
-        zoom = self._scene.zoom if hasattr(self._scene, 'zoom') else 1.0
+        zoom = self._get_zoom()
 
         x, y = self._compute_anchor_pos(zoom)
 
-        # Center pixmap at (x, y)
-        self._pixmap_item.setPos(x - pw / 2, y - ph / 2)
-
-        # Crosshair lines spanning the image
-        self._hori_line.setLine(x - pw / 2, y, x + pw / 2, y)
-        self._vert_line.setLine(x, y - ph / 2, x, y + ph / 2)
-
         # Circle radii — scale with zoom in gantry mode, else with scale
         if self.anchor == "gantry":
             r = self.radius * zoom
@@ -255,54 +370,67 @@ class CameraOverlay:
             else:
                 r = self.radius * self.scale
 
-        self._inner_circle.setRect(x - r, y - r, 2 * r, 2 * r)
-        r2 = 2 * r
-        self._outer_circle.setRect(x - r2, y - r2, 2 * r2, 2 * r2)
+        # Most frames change neither the item shapes nor the position
+        shape = (pw, ph, r)
+        if shape != self._last_shape:
+            self._last_shape = shape
+            # Geometry relative to the group origin, i.e. (x, y)
+            self._pixmap_item.setOffset(-pw / 2, -ph / 2)
+            self._hori_line.setLine(-pw / 2, 0, pw / 2, 0)
+            self._vert_line.setLine(0, -ph / 2, 0, ph / 2)
+            self._inner_circle.setRect(-r, -r, 2 * r, 2 * r)
+            r2 = 2 * r
+            self._outer_circle.setRect(-r2, -r2, 2 * r2, 2 * r2)
+
+        pos = (x, y)
+        if pos != self._last_pos:
+            self._last_pos = pos
+            self._group.setPos(x, y)
 
     def _compute_anchor_pos(self, zoom):
-        """Compute the center position for camera overlay in scene coords."""
+        """Compute the center position for camera overlay in scene coords.
+
+        The result is cached against everything it depends on, so the
+        projection / mapToScene only run when one of those changes.
+        """
         if self.anchor == "gantry":
-            # Project gantry position to scene coordinates
             view_mode = self._scene.view_mode
-            coords = ViewTransform.project_3d_to_2d(
-                [(self._gantry_wx, self._gantry_wy, self._gantry_wz)],
+            key = (self._gantry_wx, self._gantry_wy, self._gantry_wz,
+                   view_mode, zoom, self.camera_dx, self.camera_dy,
+                   self.camera_switch)
+            if key == self._anchor_key:
+                return self._anchor_pos
+
+            # Project gantry position to scene coordinates
+            x, y = ViewTransform.project_point_3d_to_2d(
+                self._gantry_wx, self._gantry_wy, self._gantry_wz,
                 view_mode, zoom)
-            if coords:
-                x, y = coords[0]
-            else:
-                x, y = 0, 0
 
             # Apply camera offset (unless in camera-switch mode)
             if not self.camera_switch:
                 x += self.camera_dx * zoom
                 y -= self.camera_dy * zoom
 
+            self._anchor_key = key
+            self._anchor_pos = (x, y)
             return x, y
 
         # Viewport-anchored modes — map viewport edges to scene coords
-        vp = self._view.viewport()
+        vp = self._vp
         vw = vp.width() if vp else 800
         vh = vp.height() if vp else 600
 
-        pixmap = self._pixmap_item.pixmap()
-        pw2 = pixmap.width() / 2
-        ph2 = pixmap.height() / 2
-
-        # Default: center of viewport
-        vx = vw / 2
-        vy = vh / 2
-
-        anchor = self.anchor
-        if "n" in anchor:
-            vy = ph2
-        elif "s" in anchor:
-            vy = vh - ph2
+        kx, sx, ky, sy = self._anchor_k
+        vx = int(kx * vw + sx * self._pw / 2)
+        vy = int(ky * vh + sy * self._ph / 2)
 
-        if "w" in anchor:
-            vx = pw2
-        elif "e" in anchor:
-            vx = vw - pw2
+        # viewportTransform() covers both zoom and scroll position
+        key = (vx, vy, self._view.viewportTransform())
+        if key == self._anchor_key:
+            return self._anchor_pos
 
         # Map viewport pixel to scene coordinate
-        scene_pt = self._view.mapToScene(QPoint(int(vx), int(vy)))
-        return scene_pt.x(), scene_pt.y()
+        scene_pt = self._view.mapToScene(QPoint(vx, vy))
+        self._anchor_key = key
+        self._anchor_pos = (scene_pt.x(), scene_pt.y())
+        return self._anchor_pos
@@ -6,7 +6,7 @@
 
 import os
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QGroupBox, QLabel, QPushButton, QDoubleSpinBox,
@@ -36,6 +36,20 @@ class CameraTab(QWidget):
         # Save counter for filenames
         self._save_counter = 0
 
+        # Coalesce bursts of setting edits into one overlay update
+        self._push_timer = QTimer(self)
+        self._push_timer.setSingleShot(True)
+        self._push_timer.setInterval(50)
+        self._push_timer.timeout.connect(self._push_settings)
+
+        # Restores the Save button label after a save confirmation;
+        # restarted by each save so quick saves keep the newest label
+        self._save_label_timer = QTimer(self)
+        self._save_label_timer.setSingleShot(True)
+        self._save_label_timer.setInterval(2000)
+        self._save_label_timer.timeout.connect(
+            lambda: self.save_btn.setText("Save"))
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
 
@@ -183,6 +197,12 @@ class CameraTab(QWidget):
 
         layout.addStretch()
 
+        # Widgets whose changes are pushed to the overlay
+        self._settings_widgets = (
+            self.location, self.rotation, self.xcenter, self.ycenter,
+            self.scale, self.diameter, self.dx, self.dy, self.z_offset,
+        )
+
         self.loadConfig()
 
     # ------------------------------------------------------------------
@@ -197,7 +217,12 @@ class CameraTab(QWidget):
     # Settings → overlay
     # ------------------------------------------------------------------
     def _on_settings_changed(self):
-        self._push_settings()
+        self._push_timer.start()
+
+    def _block_settings_signals(self, block):
+        """Mute/unmute the settings widgets around bulk updates."""
+        for widget in self._settings_widgets:
+            widget.blockSignals(block)
 
     def _push_settings(self):
         """Push all UI values to the overlay."""
@@ -288,8 +313,9 @@ class CameraTab(QWidget):
         self._save_counter += 1
         filename = f"camera{self._save_counter:02d}.png"
         self._overlay.save(filename)
-        QMessageBox.information(
-            self, "Camera Save", f"Saved frame as {filename}")
+        # Non-modal confirmation: a message box would stall the feed
+        self.save_btn.setText(f"Saved {filename}")
+        self._save_label_timer.start()
 
     # ------------------------------------------------------------------
     # Registration
@@ -305,8 +331,11 @@ class CameraTab(QWidget):
         cy = CNC.vars.get("wy", 0.0)
         dx_val = self._spindle_x - cx
         dy_val = self._spindle_y - cy
+        self._block_settings_signals(True)
         self.dx.setValue(dx_val)
         self.dy.setValue(dy_val)
+        self._block_settings_signals(False)
+        self._push_settings()
 
     def _on_get_diameter(self):
         """Get tool diameter from CNC.vars."""
@@ -317,6 +346,8 @@ class CameraTab(QWidget):
     # Config persistence
     # ------------------------------------------------------------------
     def loadConfig(self):
+        # Apply all values first, then push them to the overlay once
+        self._block_settings_signals(True)
         anchor = Utils.getStr("Camera", "aligncam_anchor", "Center")
         idx = 0
         for i, name in enumerate(CAMERA_LOCATION_ORDER):
@@ -341,6 +372,10 @@ class CameraTab(QWidget):
             Utils.getFloat("Camera", "aligncam_dy", 0.0))
         self.z_offset.setValue(
             Utils.getFloat("Camera", "aligncam_z", 0.0))
+        self._save_counter = Utils.getInt(
+            "Camera", "aligncam_save_counter", 0)
+        self._block_settings_signals(False)
+        self._push_settings()
 
     def saveConfig(self):
         if not Utils.config.has_section("Camera"):
@@ -363,3 +398,5 @@ class CameraTab(QWidget):
                          self.dy.value())
         Utils.setFloat("Camera", "aligncam_z",
                          self.z_offset.value())
+        Utils.setInt("Camera", "aligncam_save_counter",
+                     self._save_counter)
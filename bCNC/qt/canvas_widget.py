@@ -6,20 +6,29 @@
 
 import math
 
-from PySide6.QtCore import Qt, QRectF, QPointF, Signal
+import numpy as np
+from PySide6.QtCore import (
+    Qt, QRectF, QPointF, QTimer, Signal, QByteArray, QDataStream,
+)
 from PySide6.QtGui import (
-    QPen, QColor, QBrush, QPainter, QFont,
+    QPen, QColor, QPainter, QFont,
     QWheelEvent, QMouseEvent, QKeyEvent,
-    QPolygonF, QPainterPath, QImage, QPixmap,
+    QPolygonF, QPainterPath, QImage, QPixmap, QFontMetricsF,
 )
 from PySide6.QtWidgets import (
     QGraphicsView, QGraphicsScene, QGraphicsLineItem,
-    QGraphicsEllipseItem, QGraphicsSimpleTextItem,
-    QGraphicsPathItem, QGraphicsPixmapItem,
+    QGraphicsEllipseItem,
+    QGraphicsItem, QGraphicsPathItem, QGraphicsPixmapItem,
     QWidget, QVBoxLayout, QHBoxLayout, QToolBar,
     QComboBox, QCheckBox, QLabel, QPushButton,
 )
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+import utils_core as Utils
 import ViewTransform
 import PathGeometry
 from CNC import CNC
@@ -45,6 +54,222 @@ COLORS = {
 
 ZOOM_FACTOR = 1.25
 
+# Minimum interval between coords_changed emissions (~one frame)
+COORDS_INTERVAL = 16  # ms
+
+# Clicks select the toolpath line within this many pixels
+PICK_DISTANCE = 4
+# Above this many cells around the click, _SegmentIndex tests all
+PICK_MAX_CELLS = 32
+
+# Wheel steps within this interval are applied as one zoom (~one frame)
+ZOOM_INTERVAL = 16  # ms
+
+# Scene stacking order (z-values). Toolpaths use the default 0, the
+# probe heatmap sits at -1 behind them. Decorations get their own level
+# so redraw_decorations() does not re-add them over the markers.
+Z_DECOR = 0.5    # grid, margins, workarea, axes
+Z_MARKERS = 1    # gantry, probe grid and labels
+
+# Antialiasing is turned back on this long after the last zoom/pan
+ANTIALIAS_DELAY = 150  # ms
+
+# Above this many path items the whole viewport is repainted on change;
+# computing the dirty region of each item costs more than it saves
+FULL_UPDATE_PATHS = 5000
+
+# Polylines with at least this many points are loaded into their
+# QPainterPath in one call (see _bulk_path); shorter ones are cheaper
+# to build with lineTo()
+BULK_PATH_POINTS = 32
+
+# Path elements per ToolpathItem chunk; longer paths are split so a
+# zoomed in view only strokes the chunks it shows
+TOOLPATH_CHUNK = 1024
+
+# QDataStream serialization of one QPainterPath element
+_PATH_ELEMENT = np.dtype([("type", ">i4"), ("x", ">f8"), ("y", ">f8")])
+_MOVE_TO = QPainterPath.ElementType.MoveToElement.value
+_LINE_TO = QPainterPath.ElementType.LineToElement.value
+
+
+def _bulk_path(coords, types=None):
+    """Build an open QPainterPath from an (N, 2) array in one call.
+
+    Writes the QDataStream form of the path (element count, then the
+    elements, then start index and fill rule) and deserializes it,
+    instead of one lineTo() per point. types gives the element type of
+    each point and must start with _MOVE_TO; by default the path is a
+    single polyline.
+    """
+    n = len(coords)
+    buf = np.zeros(4 + _PATH_ELEMENT.itemsize * n + 8, np.uint8)
+    buf[:4] = np.array([n], ">i4").view(np.uint8)
+    elements = buf[4:-8].view(_PATH_ELEMENT)
+    if types is None:
+        elements["type"][1:] = _LINE_TO
+    else:
+        elements["type"] = types
+        # Start of the last subpath
+        start = np.flatnonzero(types == _MOVE_TO)[-1]
+        buf[-8:-4] = np.array([start], ">i4").view(np.uint8)
+    elements["x"] = coords[:, 0]
+    elements["y"] = coords[:, 1]
+    path = QPainterPath()
+    QDataStream(QByteArray(buf.tobytes())) >> path
+    return path
+
+
+class _SegmentIndex:
+    """Uniform grid of projected toolpath segments for click picking.
+
+    Segments up to one cell long are bucketed by the cell of their
+    midpoint; the few longer ones are always tested. A query measures
+    the distance to the candidates of the cells around the point.
+    """
+
+    def __init__(self, coords, types, point_line):
+        # A segment ends at every lineTo element
+        end = np.flatnonzero(types[1:] == _LINE_TO) + 1
+        a = coords[end - 1]
+        b = coords[end]
+        self._a = a
+        self._d = b - a
+        self._line = point_line[end]
+        length = np.hypot(self._d[:, 0], self._d[:, 1])
+        # Cells relative to the bounding box keep the keys small
+        self._origin = coords.min(axis=0) if len(coords) else np.zeros(2)
+        span = float(np.ptp(coords, axis=0).max()) if len(coords) else 0.0
+        self._cell = max(
+            float(np.percentile(length, 90)) if len(end) else 0.0,
+            span / 65536.0, 1e-9)
+        short = length <= self._cell
+        self._long = np.flatnonzero(~short)
+        self._short = np.flatnonzero(short)
+        keys = self._keys((a + b)[self._short] / 2.0)
+        order = np.argsort(keys, kind="stable")
+        self._short = self._short[order]
+        self._keys_sorted = keys[order]
+
+    def _keys(self, xy):
+        cells = np.floor((xy - self._origin) / self._cell).astype(np.int64)
+        return cells[:, 0] * (1 << 32) + cells[:, 1]
+
+    def nearest(self, x, y, tolerance):
+        """Return the line index of the segment nearest to (x, y).
+
+        None if no segment lies within tolerance.
+        """
+        # A short segment's midpoint is at most half a cell from it
+        r = math.ceil((tolerance + self._cell / 2) / self._cell)
+        if r > PICK_MAX_CELLS:
+            # Zoomed far out: testing everything is cheaper
+            seg = np.arange(len(self._line))
+        else:
+            cx = math.floor((x - self._origin[0]) / self._cell)
+            cy = math.floor((y - self._origin[1]) / self._cell)
+            candidates = [self._long]
+            keys = self._keys_sorted
+            for ix in range(cx - r, cx + r + 1):
+                lo = np.searchsorted(keys, ix * (1 << 32) + cy - r)
+                hi = np.searchsorted(keys, ix * (1 << 32) + cy + r, "right")
+                candidates.append(self._short[lo:hi])
+            seg = np.concatenate(candidates)
+        if not len(seg):
+            return None
+        a = self._a[seg]
+        d = self._d[seg]
+        p = np.array((x, y)) - a
+        dd = np.einsum("ij,ij->i", d, d)
+        t = np.clip(np.einsum("ij,ij->i", p, d) / np.maximum(dd, 1e-300),
+                    0.0, 1.0)
+        dist = np.hypot(*(p - d * t[:, None]).T)
+        k = dist.argmin()
+        if dist[k] > tolerance:
+            return None
+        return int(self._line[seg[k]])
+
+
+class ToolpathItem(QGraphicsPathItem):
+    """Path item for long toolpaths that paints only exposed chunks.
+
+    The full path still provides the bounding rect and shape; paint()
+    strokes only the TOOLPATH_CHUNK sized pieces whose bounds meet the
+    exposed rect.
+    """
+
+    def __init__(self, coords, types):
+        super().__init__(_bulk_path(coords, types))
+        self.setFlag(
+            QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self._chunks = []
+        for start in range(0, len(coords), TOOLPATH_CHUNK):
+            # Overlap the previous point so the chunks stay connected
+            first = max(start - 1, 0)
+            end = start + TOOLPATH_CHUNK
+            chunk_types = types[first:end].copy()
+            chunk_types[0] = _MOVE_TO
+            chunk = coords[first:end]
+            (x0, y0), (x1, y1) = chunk.min(axis=0), chunk.max(axis=0)
+            self._chunks.append(
+                (_bulk_path(chunk, chunk_types), x0, y0, x1, y1))
+
+    def paint(self, painter, option, widget=None):
+        # Widen the exposed rect by the pen, which is cosmetic (pixels)
+        pad = (self.pen().widthF() + 1.0) / max(
+            option.levelOfDetailFromTransform(painter.worldTransform()),
+            1e-9)
+        ex0, ey0, ex1, ey1 = option.exposedRect.adjusted(
+            -pad, -pad, pad, pad).getCoords()
+        painter.setPen(self.pen())
+        for path, x0, y0, x1, y1 in self._chunks:
+            if x1 >= ex0 and x0 <= ex1 and y1 >= ey0 and y0 <= ey1:
+                painter.drawPath(path)
+
+
+class ProbeLabelsItem(QGraphicsItem):
+    """All probe Z labels as one item, drawn as text in paint().
+
+    Only the labels whose box meets the exposed rect are drawn, so the
+    text stays sharp at any zoom without one item per label.
+    """
+
+    def __init__(self, positions, texts, font, color):
+        super().__init__()
+        self.setFlag(
+            QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self._texts = texts
+        self._font = font
+        self._color = QColor(color)
+        metrics = QFontMetricsF(font)
+        self._ascent = metrics.ascent()
+        # Label boxes as (left, top, right, bottom) rows
+        widths = [metrics.horizontalAdvance(text) for text in texts]
+        self._boxes = np.empty((len(texts), 4))
+        self._boxes[:, :2] = positions
+        self._boxes[:, 2] = positions[:, 0] + widths
+        self._boxes[:, 3] = positions[:, 1] + metrics.height()
+        left, top = self._boxes[:, :2].min(axis=0)
+        right, bottom = self._boxes[:, 2:].max(axis=0)
+        self._rect = QRectF(left, top, right - left, bottom - top)
+
+    def boundingRect(self):
+        return self._rect
+
+    def paint(self, painter, option, widget=None):
+        ex0, ey0, ex1, ey1 = option.exposedRect.getCoords()
+        boxes = self._boxes
+        visible = np.flatnonzero(
+            (boxes[:, 2] >= ex0) & (boxes[:, 0] <= ex1)
+            & (boxes[:, 3] >= ey0) & (boxes[:, 1] <= ey1))
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        texts = self._texts
+        ascent = self._ascent
+        for k, (x, y) in zip(visible.tolist(),
+                             boxes[visible, :2].tolist()):
+            painter.drawText(QPointF(x, y + ascent), texts[k])
+
 
 class CNCGraphicsView(QGraphicsView):
     """Custom QGraphicsView with zoom/pan and coordinate display.
@@ -65,8 +290,8 @@ class CNCGraphicsView(QGraphicsView):
             QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(
             QGraphicsView.ViewportAnchor.AnchorViewCenter)
-        self.setViewportUpdateMode(
-            QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        if QOpenGLWidget is not None and Utils.getBool("Canvas", "opengl"):
+            self.setViewport(QOpenGLWidget())
         self.setMouseTracking(True)
         self.setBackgroundBrush(COLORS["background"])
 
@@ -74,14 +299,77 @@ class CNCGraphicsView(QGraphicsView):
         self._pan_start = QPointF()
         self._action_mode = None
 
+        # Mouse moves only record the position; the timer emits the
+        # latest one at most once per COORDS_INTERVAL
+        self._pending_coords = None
+        self._coords_timer = QTimer(self)
+        self._coords_timer.setSingleShot(True)
+        self._coords_timer.setInterval(COORDS_INTERVAL)
+        self._coords_timer.timeout.connect(self._emit_coords)
+
+        # Wheel steps multiply into _pending_zoom; the timer applies it
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(ZOOM_INTERVAL)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        # Zooming and panning repaint without antialiasing; the timer
+        # restores it once the view settles
+        self._aa_timer = QTimer(self)
+        self._aa_timer.setSingleShot(True)
+        self._aa_timer.setInterval(ANTIALIAS_DELAY)
+        self._aa_timer.timeout.connect(self._restore_antialiasing)
+
+        # Reasons to repaint the full viewport, see _update_viewport_mode()
+        self._dense = False
+        self._full_update = False
+        self._update_viewport_mode()
+
+    def set_path_count(self, count):
+        """Choose the viewport update mode for count path items."""
+        self._dense = count > FULL_UPDATE_PATHS
+        self._update_viewport_mode()
+
+    def set_full_update(self, full):
+        """Force full viewport updates, e.g. under a live camera feed."""
+        self._full_update = full
+        self._update_viewport_mode()
+
+    def _update_viewport_mode(self):
+        if self._dense or self._full_update:
+            mode = QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        else:
+            mode = QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+        self.setViewportUpdateMode(mode)
+
     def wheelEvent(self, event: QWheelEvent):
         """Zoom in/out with mouse wheel."""
         if event.angleDelta().y() > 0:
             factor = ZOOM_FACTOR
         else:
             factor = 1.0 / ZOOM_FACTOR
+        self._suspend_antialiasing()
+        self._aa_timer.start()
+        self._pending_zoom *= factor
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+
+    def _apply_zoom(self):
+        factor = self._pending_zoom
+        self._pending_zoom = 1.0
         self.scale(factor, factor)
 
+    def _suspend_antialiasing(self):
+        self._aa_timer.stop()
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+    def _restore_antialiasing(self):
+        if self._panning:
+            return  # mouseReleaseEvent() restarts the timer
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.viewport().update()
+
     def set_action_mode(self, mode):
         """Set an action mode (e.g. 'add_orient') or None to clear."""
         self._action_mode = mode
@@ -101,12 +389,14 @@ class CNCGraphicsView(QGraphicsView):
         if event.button() == Qt.MouseButton.MiddleButton:
             self._panning = True
             self._pan_start = event.position()
+            self._suspend_antialiasing()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
             event.accept()
         elif event.button() == Qt.MouseButton.LeftButton:
             scene_pos = self.mapToScene(event.position().toPoint())
-            item = self.scene().itemAt(scene_pos, self.transform())
-            path_id = self.scene().path_id_at(item) if item else None
+            path_id = self.scene().path_at(
+                scene_pos.x(), scene_pos.y(),
+                PICK_DISTANCE / abs(self.transform().m11()))
             if path_id is not None:
                 bid, lid = path_id
                 ctrl = bool(event.modifiers() & Qt.KeyboardModifier.ControlModifier)
@@ -120,6 +410,7 @@ class CNCGraphicsView(QGraphicsView):
     def mouseReleaseEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.MiddleButton:
             self._panning = False
+            self._aa_timer.start()
             self.setCursor(Qt.CursorShape.ArrowCursor)
             event.accept()
         else:
@@ -136,25 +427,28 @@ class CNCGraphicsView(QGraphicsView):
             event.accept()
         else:
             # Update coordinate display
-            scene_pos = self.mapToScene(event.position().toPoint())
-            self.coords_changed.emit(scene_pos.x(), scene_pos.y(), 0.0)
+            self._pending_coords = self.mapToScene(
+                event.position().toPoint())
+            if not self._coords_timer.isActive():
+                self._coords_timer.start()
             super().mouseMoveEvent(event)
 
+    def _emit_coords(self):
+        pos = self._pending_coords
+        self.coords_changed.emit(pos.x(), pos.y(), 0.0)
+
     def fit_to_content(self):
         """Zoom to fit path content in view (excludes workarea/grid/axes)."""
         scene = self.scene()
         # Prefer fitting to path items only so the workarea rect
         # (which can be 300x300mm) doesn't dominate the viewport.
-        if hasattr(scene, '_path_items') and scene._path_items:
-            rect = QRectF()
-            for item in scene._path_items:
-                rect = rect.united(item.sceneBoundingRect())
-        else:
+        rect = getattr(scene, "_paths_bbox", None)
+        if rect is None:
             rect = scene.itemsBoundingRect()
         if rect.isNull():
             return
         margin = max(rect.width(), rect.height()) * 0.05
-        rect.adjust(-margin, -margin, margin, margin)
+        rect = rect.adjusted(-margin, -margin, margin, margin)
         self.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
 
 
@@ -168,6 +462,9 @@ class CNCScene(QGraphicsScene):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # A rebuild inserts thousands of path items; without a BSP tree
+        # to maintain, inserting and clearing them is cheaper
+        self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.view_mode = ViewTransform.VIEW_XY
         self.zoom = 1.0
 
@@ -186,13 +483,25 @@ class CNCScene(QGraphicsScene):
         # Probe overlay items
         self._probe_items = []
 
+        # Grid, margin, workarea and axes items, see redraw_decorations()
+        self._decor_items = []
+        # {name: (key, QPainterPath)} of _add_segments_item()
+        self._segments_cache = {}
+        # Shared pens, see _make_pen()
+        self._pens = {}
+        self._probe_font = QFont("monospace", 7)
+
         # Work offset (for workarea rectangle)
         self._dx = 0.0
         self._dy = 0.0
 
         # Track path items for selection highlighting
         self._path_items = {}
-        self._selection_state = {}  # {item: original_pen} for rollback
+        self._path_pens = {}        # {item: shared pen from _make_pen()}
+        self._paths_bbox = None     # QRectF around all path points
+        self._segments = None       # _SegmentIndex for path_at()
+        self._line_ids = []         # (block id, line id) per indexed line
+        self._selection_state = []  # highlighted items, for rollback
 
     def rebuild(self, gcode, cnc):
         """Full redraw: clear scene and rebuild everything.
@@ -204,16 +513,35 @@ class CNCScene(QGraphicsScene):
         self.clear()
         self._gantry_items = []
         self._probe_items = []
+        self._decor_items = []
         self._path_items = {}
-        self._selection_state = {}
+        self._path_pens = {}
+        self._paths_bbox = None
+        self._segments = None
+        self._line_ids = []
+        self._selection_state = []
 
         # Draw paths first so margins are computed before grid/workarea
         self._draw_paths(gcode, cnc)
+        self._draw_decorations()
+        self._draw_gantry(0, 0)
+
+    def redraw_decorations(self):
+        """Redraw grid, margins, workarea and axes, keeping the paths.
+
+        Used when one of their draw flags is toggled, which does not
+        need the G-code to be evaluated again.
+        """
+        for item in self._decor_items:
+            self.removeItem(item)
+        self._decor_items = []
+        self._draw_decorations()
+
+    def _draw_decorations(self):
         self._draw_grid()
         self._draw_margin()
         self._draw_workarea()
         self._draw_axes()
-        self._draw_gantry(0, 0)
 
     def update_gantry(self, wx, wy, wz, mx, my, mz):
         """Update gantry position marker.
@@ -222,11 +550,9 @@ class CNCScene(QGraphicsScene):
             wx, wy, wz: Work position.
             mx, my, mz: Machine position.
         """
-        coords = ViewTransform.project_3d_to_2d(
-            [(wx, wy, wz)], self.view_mode, self.zoom)
-        if coords:
-            cx, cy = coords[0]
-            self._draw_gantry(cx, cy)
+        cx, cy = ViewTransform.project_point_3d_to_2d(
+            wx, wy, wz, self.view_mode, self.zoom)
+        self._draw_gantry(cx, cy)
 
         # Update work offset for workarea
         dx = wx - mx
@@ -241,14 +567,20 @@ class CNCScene(QGraphicsScene):
             xyz, self.view_mode, self.zoom)
 
     def _make_pen(self, color, width=1, dash=None):
-        """Create a cosmetic QPen (constant pixel width regardless of zoom)."""
-        if isinstance(color, str):
-            color = QColor(color)
-        pen = QPen(color)
-        pen.setWidthF(width)
-        pen.setCosmetic(True)
-        if dash:
-            pen.setStyle(Qt.PenStyle.DashLine)
+        """Return a cosmetic QPen (constant pixel width regardless of zoom).
+
+        Pens are shared per (color, width, dash): callers must not
+        modify the returned pen.
+        """
+        key = (color if isinstance(color, str) else color.rgba(),
+               width, bool(dash))
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = self._pens[key] = QPen(QColor(color))
+            pen.setWidthF(width)
+            pen.setCosmetic(True)
+            if dash:
+                pen.setStyle(Qt.PenStyle.DashLine)
         return pen
 
     def _draw_grid(self):
@@ -260,17 +592,14 @@ class CNCScene(QGraphicsScene):
         ):
             return
 
-        grid_lines = PathGeometry.generate_grid_lines(
+        bounds = (
             CNC.vars.get("axmin", -100), CNC.vars.get("axmax", 100),
             CNC.vars.get("aymin", -100), CNC.vars.get("aymax", 100),
         )
         pen = self._make_pen(COLORS["grid"], 0.5, dash=True)
-        for xyz in grid_lines:
-            coords = self._project(xyz)
-            if len(coords) >= 2:
-                self.addLine(
-                    coords[0][0], coords[0][1],
-                    coords[1][0], coords[1][1], pen)
+        self._add_decor(self._add_segments_item(
+            "grid", bounds,
+            lambda: PathGeometry.generate_grid_lines(*bounds), pen))
 
     def _draw_margin(self):
         if not self.draw_margin:
@@ -281,21 +610,24 @@ class CNCScene(QGraphicsScene):
                 CNC.vars["xmin"], CNC.vars["ymin"],
                 CNC.vars["xmax"], CNC.vars["ymax"],
             )
-            self._draw_polyline(xyz, COLORS["margin"], width=1)
+            self._add_decor(
+                self._draw_polyline(xyz, COLORS["margin"], width=1))
 
         if CNC.isAllMarginValid():
             xyz = PathGeometry.generate_margin_rect(
                 CNC.vars["axmin"], CNC.vars["aymin"],
                 CNC.vars["axmax"], CNC.vars["aymax"],
             )
-            self._draw_polyline(xyz, COLORS["margin"], width=1, dash=True)
+            self._add_decor(self._draw_polyline(
+                xyz, COLORS["margin"], width=1, dash=True))
 
     def _draw_workarea(self):
         if not self.draw_workarea:
             return
         xyz = PathGeometry.generate_workarea_rect(
             self._dx, self._dy, CNC.travel_x, CNC.travel_y)
-        self._draw_polyline(xyz, COLORS["workarea"], width=1, dash=True)
+        self._add_decor(self._draw_polyline(
+            xyz, COLORS["workarea"], width=1, dash=True))
 
     def _draw_axes(self):
         if not self.draw_axes:
@@ -314,9 +646,14 @@ class CNCScene(QGraphicsScene):
             coords = self._project(xyz)
             if len(coords) >= 2:
                 pen = self._make_pen(axis_colors[name], 1.5, dash=True)
-                self.addLine(
+                self._add_decor(self.addLine(
                     coords[0][0], coords[0][1],
-                    coords[1][0], coords[1][1], pen)
+                    coords[1][0], coords[1][1], pen))
+
+    def _add_decor(self, item):
+        if item is not None:
+            item.setZValue(Z_DECOR)
+            self._decor_items.append(item)
 
     def _draw_gantry(self, cx, cy):
         """Draw/update the gantry position marker."""
@@ -331,6 +668,7 @@ class CNCScene(QGraphicsScene):
         if self.view_mode == ViewTransform.VIEW_XY:
             ellipse = self.addEllipse(
                 cx - r, cy - r, 2 * r, 2 * r, pen)
+            ellipse.setZValue(Z_MARKERS)
             self._gantry_items.append(ellipse)
         else:
             # Side/ISO view: triangle + oval
@@ -343,10 +681,16 @@ class CNCScene(QGraphicsScene):
                 QPointF(cx - gx, cy - gh),
             ])
             item = self.addPolygon(triangle, pen)
+            item.setZValue(Z_MARKERS)
             self._gantry_items.append(item)
 
     def _draw_paths(self, gcode, cnc):
-        """Draw all GCode toolpaths."""
+        """Draw all GCode toolpaths.
+
+        The lines are evaluated one by one, but their points are
+        projected in a single call afterwards and each block gets one
+        path item per pen (feed, rapid) instead of one per line.
+        """
         if not self.draw_paths:
             return
 
@@ -354,8 +698,18 @@ class CNCScene(QGraphicsScene):
         cnc.resetAllMargins()
         last = (0.0, 0.0, 0.0)
 
+        points = []      # xyz of all drawn lines, concatenated
+        sizes = []       # point count of each drawn line
+        line_group = []  # group index of each drawn line
+        line_ids = []    # (block id, line id) of each drawn line
+        groups = []      # (block id, first line id, rapid) of each group
+        group_index = {}
+        block_groups = []  # (block, group index or None for each line)
+
         for i, block in enumerate(gcode.blocks):
             block.resetPath()
+            line_groups = []
+            block_groups.append((block, line_groups))
 
             for j, line in enumerate(block):
                 try:
@@ -368,7 +722,7 @@ class CNCScene(QGraphicsScene):
                     cmd = None
 
                 if cmd is None:
-                    block.addPath(None)
+                    line_groups.append(None)
                     continue
 
                 cnc.motionStart(cmd)
@@ -376,53 +730,119 @@ class CNCScene(QGraphicsScene):
                 cnc.motionEnd()
 
                 if not xyz:
-                    block.addPath(None)
+                    line_groups.append(None)
                     continue
 
                 cnc.pathLength(block, xyz)
                 if cnc.gcode in (1, 2, 3):
                     block.pathMargins(xyz)
-                    cnc.pathMargins(block)
 
+                rapid = cnc.gcode == 0
                 if block.enable:
-                    if cnc.gcode == 0 and self.draw_rapid:
+                    if rapid and self.draw_rapid:
                         xyz = list(xyz)
                         xyz[0] = last
                     last = xyz[-1]
-                else:
-                    if cnc.gcode == 0:
-                        block.addPath(None)
-                        continue
-
-                coords = self._project(xyz)
-                if not coords or len(coords) < 2:
-                    block.addPath(None)
+                elif rapid:
+                    line_groups.append(None)
                     continue
 
-                if block.enable:
-                    color = QColor(block.color) if block.color else COLORS["enable"]
-                else:
-                    color = COLORS["disable"]
-
-                if cnc.gcode == 0:
-                    if self.draw_rapid:
-                        pen = self._make_pen(color, 0.5, dash=True)
-                    else:
-                        block.addPath(None)
-                        continue
-                else:
-                    pen = self._make_pen(color, 1)
+                if len(xyz) < 2 or (rapid and not self.draw_rapid):
+                    line_groups.append(None)
+                    continue
 
-                item = self._add_polyline_item(coords, pen)
-                self._path_items[item] = (i, j)
-                block.addPath(id(item))
+                key = (i, rapid)
+                g = group_index.get(key)
+                if g is None:
+                    g = group_index[key] = len(groups)
+                    groups.append((i, j, rapid))
+                points.extend(xyz)
+                sizes.append(len(xyz))
+                line_group.append(g)
+                line_ids.append((i, j))
+                line_groups.append(g)
 
             block.endPath(cnc.x, cnc.y, cnc.z)
+            # Block margins only grow, so merging them once at the end
+            # matches merging after every line; unset ones are no-ops
+            cnc.pathMargins(block)
+
+        items = self._add_path_groups(
+            gcode, points, sizes, line_group, groups)
+        self._line_ids = line_ids
+        for block, line_groups in block_groups:
+            for g in line_groups:
+                block.addPath(None if g is None else id(items[g]))
+
+    def _add_path_groups(self, gcode, points, sizes, line_group, groups):
+        """Project the collected lines and add one item per group.
+
+        Returns the items, indexed like groups.
+        """
+        if not sizes:
+            return []
+        coords = self._project(points)
+        (xmin, ymin), (xmax, ymax) = coords.min(axis=0), coords.max(axis=0)
+        self._paths_bbox = QRectF(
+            QPointF(xmin, ymin), QPointF(xmax, ymax))
+        types = np.full(len(coords), _LINE_TO, np.int32)
+        types[np.cumsum(sizes) - sizes] = _MOVE_TO
+        group = np.repeat(line_group, sizes)
+        # Drop zero length segments (e.g. plunges seen from above) as
+        # lineTo() would, so they do not stroke as dots
+        keep = np.ones(len(coords), bool)
+        keep[1:] = ((types[1:] == _MOVE_TO)
+                    | (coords[1:] != coords[:-1]).any(axis=1))
+        coords = coords[keep]
+        types = types[keep]
+        group = group[keep]
+        self._segments = _SegmentIndex(
+            coords, types, np.repeat(np.arange(len(sizes)), sizes)[keep])
+        # Reorder the points so each group is contiguous, keeping the
+        # line order within a group
+        order = np.argsort(group, kind="stable")
+        coords = coords[order]
+        types = types[order]
+        bounds = np.searchsorted(group[order], np.arange(len(groups) + 1))
+
+        items = []
+        for g, (i, j, rapid) in enumerate(groups):
+            block = gcode.blocks[i]
+            if block.enable:
+                color = block.color or COLORS["enable"]
+            else:
+                color = COLORS["disable"]
+            if rapid:
+                pen = self._make_pen(color, 0.5, dash=True)
+            else:
+                pen = self._make_pen(color, 1)
+            a, b = bounds[g], bounds[g + 1]
+            if b - a > TOOLPATH_CHUNK:
+                item = ToolpathItem(coords[a:b], types[a:b])
+            else:
+                item = QGraphicsPathItem(
+                    _bulk_path(coords[a:b], types[a:b]))
+            item.setPen(pen)
+            self.addItem(item)
+            self._path_items[item] = (i, j)
+            self._path_pens[item] = pen
+            items.append(item)
+        return items
 
     def path_id_at(self, item):
         """Return (block_id, line_id) for a path item, or None."""
         return self._path_items.get(item)
 
+    def path_at(self, x, y, tolerance):
+        """Return (block_id, line_id) of the toolpath line nearest (x, y).
+
+        Returns None if no line lies within tolerance (scene units).
+        """
+        if self._segments is None:
+            return None
+        line = self._segments.nearest(x, y, tolerance)
+        return None if line is None else self._line_ids[line]
+
     def highlight_selection(self, block_ids):
         """Highlight paths belonging to the given block ids."""
         self.clear_selection()
@@ -432,14 +852,14 @@ class CNCScene(QGraphicsScene):
         highlight_pen = self._make_pen(COLORS["select"], 2)
         for item, (bid, lid) in self._path_items.items():
             if bid in bid_set:
-                self._selection_state[item] = QPen(item.pen())
+                self._selection_state.append(item)
                 item.setPen(highlight_pen)
 
     def clear_selection(self):
         """Restore original pens on previously highlighted items."""
-        for item, pen in self._selection_state.items():
+        for item in self._selection_state:
             try:
-                item.setPen(pen)
+                item.setPen(self._path_pens[item])
             except RuntimeError:
                 pass  # item already deleted by scene.clear()
         self._selection_state.clear()
@@ -491,90 +911,81 @@ class CNCScene(QGraphicsScene):
         if xstep <= 0 or ystep <= 0:
             return
 
+        key = (probe.xmin, probe.xmax, probe.ymin, probe.ymax,
+               probe.xn, probe.yn, xstep, ystep)
+        item = self._add_segments_item(
+            "probe", key, lambda: self._probe_grid_lines(probe), pen)
+        if item is not None:
+            item.setZValue(Z_MARKERS)
+            self._probe_items.append(item)
+
+    @staticmethod
+    def _probe_grid_lines(probe):
+        """Return the probe grid as (N, 2, 3) line segments."""
+        xs = probe.xmin + probe._xstep * np.arange(probe.xn)
+        ys = probe.ymin + probe._ystep * np.arange(probe.yn)
+        lines = np.zeros((len(xs) + len(ys), 2, 3))
+
         # Vertical lines
-        for i in range(probe.xn):
-            x = probe.xmin + xstep * i
-            pts = [(x, probe.ymin, 0), (x, probe.ymax, 0)]
-            coords = self._project(pts)
-            if len(coords) >= 2:
-                item = self.addLine(
-                    coords[0][0], coords[0][1],
-                    coords[1][0], coords[1][1], pen)
-                self._probe_items.append(item)
+        vert = lines[:len(xs)]
+        vert[:, :, 0] = xs[:, None]
+        vert[:, 0, 1] = probe.ymin
+        vert[:, 1, 1] = probe.ymax
 
         # Horizontal lines
-        for j in range(probe.yn):
-            y = probe.ymin + ystep * j
-            pts = [(probe.xmin, y, 0), (probe.xmax, y, 0)]
-            coords = self._project(pts)
-            if len(coords) >= 2:
-                item = self.addLine(
-                    coords[0][0], coords[0][1],
-                    coords[1][0], coords[1][1], pen)
-                self._probe_items.append(item)
+        horiz = lines[len(xs):]
+        horiz[:, 0, 0] = probe.xmin
+        horiz[:, 1, 0] = probe.xmax
+        horiz[:, :, 1] = ys[:, None]
+        return lines
 
     def _draw_probe_points(self, probe):
-        """Draw green Z-height text labels at each probed point."""
+        """Draw green Z-height text labels at each probed point.
+
+        All labels share one ProbeLabelsItem rather than one text item
+        per point.
+        """
         if not probe.points:
             return
 
-        font = QFont("monospace", 7)
-        for x, y, z in probe.points:
-            coords = self._project([(x, y, z)])
-            if not coords:
-                continue
-            cx, cy = coords[0]
-            text = QGraphicsSimpleTextItem(f"{z:.3f}")
-            text.setFont(font)
-            text.setBrush(QBrush(QColor("green")))
-            text.setPos(cx + 2, cy - 10)
-            self.addItem(text)
-            self._probe_items.append(text)
+        coords = self._project(probe.points)
+        # Each label's top-left sits at (cx + 2, cy - 10)
+        item = ProbeLabelsItem(
+            coords + (2.0, -10.0),
+            [f"{z:.3f}" for _x, _y, z in probe.points],
+            self._probe_font, "green")
+        item.setZValue(Z_MARKERS)
+        self.addItem(item)
+        self._probe_items.append(item)
 
     def _draw_probe_heatmap(self, probe):
         """Draw a heatmap from probe Z data (blue-white-red).
 
-        Requires probe.matrix to be populated. Uses QImage for pixel
-        rendering without numpy/PIL dependency.
+        Requires probe.matrix to be populated. The colors are computed
+        for the whole matrix at once with numpy and packed into an
+        ARGB32 buffer wrapped by a QImage.
         """
         if probe.isEmpty():
             return
 
-        # Find Z range for color mapping
-        zmin = float("inf")
-        zmax = float("-inf")
-        for row in probe.matrix:
-            for val in row:
-                if val < zmin:
-                    zmin = val
-                if val > zmax:
-                    zmax = val
-
-        zrange = zmax - zmin
+        m = np.asarray(probe.matrix, dtype=np.float32)
+        zmin = m.min()
+        zrange = m.max() - zmin
         if zrange < 1e-10:
             return
 
-        # Create image: 1 pixel per probe point
-        w = probe.xn
-        h = probe.yn
-        img = QImage(w, h, QImage.Format.Format_ARGB32)
-        img.fill(Qt.GlobalColor.transparent)
-
-        for j in range(h):
-            for i in range(w):
-                t = (probe.matrix[j][i] - zmin) / zrange  # 0..1
-                # Blue (low) → White (mid) → Red (high)
-                if t < 0.5:
-                    s = t * 2  # 0..1
-                    r = int(s * 255)
-                    g = int(s * 255)
-                    b = 255
-                else:
-                    s = (t - 0.5) * 2  # 0..1
-                    r = 255
-                    g = int((1 - s) * 255)
-                    b = int((1 - s) * 255)
-                img.setPixelColor(i, j, QColor(r, g, b, 120))
+        # 1 pixel per probe point
+        h, w = m.shape
+        t = (m - zmin) / zrange  # 0..1
+        # Blue (low) → White (mid) → Red (high): red ramps up over the
+        # lower half, blue down over the upper half, green follows
+        # whichever of the two is ramping
+        r = np.minimum(t * 510.0, 255.0).astype(np.uint32)
+        b = np.minimum((1.0 - t) * 510.0, 255.0).astype(np.uint32)
+        g = np.minimum(r, b)
+        argb = np.ascontiguousarray(
+            (120 << 24) | (r << 16) | (g << 8) | b, dtype=np.uint32)
+        img = QImage(argb.data, w, h, 4 * w, QImage.Format.Format_ARGB32)
 
         # Project the probe area corners to get placement
         corners = [
@@ -604,12 +1015,44 @@ class CNCScene(QGraphicsScene):
         self.addItem(item)
         self._probe_items.append(item)
 
+    def _add_segments_item(self, name, key, make_lines, pen):
+        """Add world-space line segments as one path item.
+
+        make_lines() returns the segments as an (N, 2, 3) array. The
+        projected path is kept under name and reused while key and the
+        view mode and zoom stay the same. Returns None if there are no
+        segments.
+        """
+        key = (key, self.view_mode, self.zoom)
+        cached = self._segments_cache.get(name)
+        if cached is None or cached[0] != key:
+            lines = make_lines()
+            path = QPainterPath()
+            if len(lines):
+                types = np.empty(2 * len(lines), np.int32)
+                types[0::2] = _MOVE_TO
+                types[1::2] = _LINE_TO
+                path = _bulk_path(self._project(lines), types)
+            cached = self._segments_cache[name] = (key, path)
+        if cached[1].isEmpty():
+            return None
+        return self.addPath(cached[1], pen)
+
     def _add_polyline_item(self, coords, pen):
-        """Add a polyline as connected line segments to the scene."""
-        path = QPainterPath()
-        path.moveTo(coords[0][0], coords[0][1])
-        for x, y in coords[1:]:
-            path.lineTo(x, y)
+        """Add a polyline as connected line segments to the scene.
+
+        coords may be any iterable of (x, y) pairs with at least one
+        point. Long (N, 2) arrays are loaded in bulk.
+        """
+        if (isinstance(coords, np.ndarray)
+                and len(coords) >= BULK_PATH_POINTS):
+            path = _bulk_path(coords)
+        else:
+            points = iter(coords)
+            path = QPainterPath()
+            path.moveTo(*next(points))
+            for x, y in points:
+                path.lineTo(x, y)
         item = QGraphicsPathItem(path)
         item.setPen(pen)
         self.addItem(item)
@@ -686,6 +1129,15 @@ class CanvasPanel(QWidget):
         self.view.canvas_block_clicked.connect(
             self.signals.canvas_block_clicked.emit)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.camera_overlay.resume()
+
+    def hideEvent(self, event):
+        # Also delivered (spontaneously) when the window is minimized
+        self.camera_overlay.pause()
+        super().hideEvent(event)
+
     def _on_view_changed(self, index):
         self.scene.view_mode = index
         self.signals.view_changed.emit(index)
@@ -700,6 +1152,7 @@ class CanvasPanel(QWidget):
         """Full redraw."""
         self.camera_overlay.reset_items()
         self.scene.rebuild(gcode, cnc)
+        self.view.set_path_count(len(self.scene._path_items))
 
     def update_gantry(self, wx, wy, wz, mx, my, mz):
         """Update gantry position marker."""
@@ -715,10 +1168,19 @@ class CanvasPanel(QWidget):
         self.scene.highlight_selection(block_ids)
 
     def _make_toggle(self, attr):
-        """Return a slot that sets a scene draw flag and triggers redraw."""
+        """Return a slot that sets a scene draw flag and triggers redraw.
+
+        Only the paths flags need the full rebuild; the others redraw
+        just their own items.
+        """
         def _toggle(checked):
             setattr(self.scene, attr, checked)
-            self.signals.draw_requested.emit()
+            if attr == "draw_probe":
+                self.signals.draw_probe.emit()
+            elif attr in ("draw_paths", "draw_rapid"):
+                self.signals.draw_requested.emit()
+            else:
+                self.scene.redraw_decorations()
         return _toggle
 
     # ------------------------------------------------------------------
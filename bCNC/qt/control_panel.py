@@ -3,14 +3,16 @@
 # Replaces parts of ControlPage with a compact QWidget providing
 # digital readout (DRO), connection controls, and jog buttons.
 
+import functools
 import logging
+import time
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QGroupBox, QLabel, QLineEdit, QPushButton,
-    QComboBox, QDoubleSpinBox, QDialog, QTextEdit,
+    QComboBox, QDoubleSpinBox, QDialog, QPlainTextEdit,
 )
 
 import utils_core as Utils
@@ -21,35 +23,72 @@ from Sender import CONNECTED, NOT_CONNECTED, STATECOLOR
 # Jog step sizes (mm)
 JOG_STEPS = [0.001, 0.01, 0.1, 1.0, 5.0, 10.0, 50.0, 100.0]
 
+# Rotary axes shown with enable6axisopt: (axis, work var, machine var)
+ROTARY_AXES = (("A", "wa", "ma"), ("B", "wb", "mb"), ("C", "wc", "mc"))
+
+# Serial port scans are reused for this long
+PORTS_TTL = 2.0  # s
+_PORTS_CACHE = {"time": None, "ports": []}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_font(value, default_family, default_size, default_bold):
+    """Parse a [Font] config string into (family, size, bold, italic)."""
+    family, size, bold, italic = default_family, default_size, default_bold, False
+    if value:
+        parts = [p.strip() for p in value.split(",")]
+        if parts:
+            family = parts[0]
+        if len(parts) > 1:
+            try:
+                size = abs(int(parts[1]))
+            except ValueError:
+                pass
+        for p in parts[2:]:
+            if p.lower() == "bold":
+                bold = True
+            elif p.lower() == "italic":
+                italic = True
+    return family, size, bold, italic
+
 
 def _config_font(key, default_family="Sans", default_size=12, default_bold=False):
     """Load a QFont from [Font] config section.
 
     Config format: "FontFamily,size[,bold][,italic]" (matches Tkinter convention).
+    The config is read on every call, so edits take effect; only the
+    parse is cached, and a new QFont is returned each time.
     """
-    family, size, bold, italic = default_family, default_size, default_bold, False
     try:
         value = Utils.config.get("Font", key)
-        if value:
-            parts = [p.strip() for p in value.split(",")]
-            if parts:
-                family = parts[0]
-            if len(parts) > 1:
-                try:
-                    size = abs(int(parts[1]))
-                except ValueError:
-                    pass
-            for p in parts[2:]:
-                if p.lower() == "bold":
-                    bold = True
-                elif p.lower() == "italic":
-                    italic = True
     except Exception:
         logging.debug("Failed to load font config for '%s', using defaults", key)
+        value = None
+    family, size, bold, italic = _parse_font(
+        value, default_family, default_size, default_bold)
     weight = QFont.Weight.Bold if bold else QFont.Weight.Normal
     return QFont(family, size, weight, italic)
 
 
+def _serial_ports(force_refresh=False):
+    """Device names of the available serial ports.
+
+    Enumerating ports walks sysfs or the registry, so a scan is reused
+    for PORTS_TTL seconds unless force_refresh is set.
+    """
+    now = time.monotonic()
+    stamp = _PORTS_CACHE["time"]
+    if force_refresh or stamp is None or now - stamp >= PORTS_TTL:
+        try:
+            import serial.tools.list_ports
+        except ImportError:
+            return []
+        _PORTS_CACHE["ports"] = [
+            port.device for port in serial.tools.list_ports.comports()]
+        _PORTS_CACHE["time"] = now
+    return _PORTS_CACHE["ports"]
+
+
 class DROWidget(QWidget):
     """Digital Readout showing work and machine positions."""
 
@@ -76,9 +115,11 @@ class DROWidget(QWidget):
             "X": "red", "Y": "green", "Z": "blue",
             "A": "#FF8C00", "B": "#00CED1", "C": "#DA70D6",
         }
+        # The DRO rows are fixed at construction
+        self._six = bool(getattr(CNC, "enable6axisopt", False))
         axes = list("XYZ")
-        if getattr(CNC, "enable6axisopt", False):
-            axes += list("ABC")
+        if self._six:
+            axes += [axis for axis, _, _ in ROTARY_AXES]
 
         for row, axis in enumerate(axes, start=1):
             name_lbl = QLabel(axis)
@@ -104,19 +145,38 @@ class DROWidget(QWidget):
             layout.addWidget(m_lbl, row, 2)
             self._mach_labels[axis] = m_lbl
 
+        # Labels in update_position() order, with the text they show
+        self._labels = [self._work_labels[a] for a in "XYZ"]
+        self._labels += [self._mach_labels[a] for a in "XYZ"]
+        for axis in axes[3:]:
+            self._labels += [self._work_labels[axis], self._mach_labels[axis]]
+        self._texts = [lbl.text() for lbl in self._labels]
+
     def update_position(self, wx, wy, wz, mx, my, mz):
-        """Update displayed coordinates."""
+        """Update displayed coordinates; unchanged labels are skipped."""
         fmt = "%.3f" if not CNC.inch else "%.4f"
-        self._work_labels["X"].setText(fmt % wx)
-        self._work_labels["Y"].setText(fmt % wy)
-        self._work_labels["Z"].setText(fmt % wz)
-        self._mach_labels["X"].setText(fmt % mx)
-        self._mach_labels["Y"].setText(fmt % my)
-        self._mach_labels["Z"].setText(fmt % mz)
-        if getattr(CNC, "enable6axisopt", False):
-            for axis, wk, mk in [("A","wa","ma"), ("B","wb","mb"), ("C","wc","mc")]:
-                self._work_labels[axis].setText(fmt % CNC.vars[wk])
-                self._mach_labels[axis].setText(fmt % CNC.vars[mk])
+        texts = [fmt % wx, fmt % wy, fmt % wz, fmt % mx, fmt % my, fmt % mz]
+        if self._six:
+            cnc_vars = CNC.vars
+            for _, wk, mk in ROTARY_AXES:
+                texts.append(fmt % cnc_vars[wk])
+                texts.append(fmt % cnc_vars[mk])
+        if texts == self._texts:
+            return
+        for lbl, text, last in zip(self._labels, texts, self._texts):
+            if text != last:
+                lbl.setText(text)
+        self._texts = texts
+
+
+class PortComboBox(QComboBox):
+    """Port combo box that announces when its list is about to open."""
+
+    popup_requested = Signal()
+
+    def showPopup(self):
+        self.popup_requested.emit()
+        super().showPopup()
 
 
 class ConnectionWidget(QWidget):
@@ -131,13 +191,21 @@ class ConnectionWidget(QWidget):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(2, 2, 2, 2)
 
-        self._port_combo = QComboBox()
+        self._port_combo = PortComboBox()
         self._port_combo.setEditable(True)
         self._port_combo.setMinimumWidth(150)
         self._populate_ports()
+        # Opening the list rescans, reusing a scan younger than PORTS_TTL
+        self._port_combo.popup_requested.connect(self._populate_ports)
         layout.addWidget(QLabel("Port:"))
         layout.addWidget(self._port_combo, 1)
 
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.setToolTip("Rescan serial ports")
+        refresh_btn.clicked.connect(
+            lambda: self._populate_ports(force_refresh=True))
+        layout.addWidget(refresh_btn)
+
         self._baud_combo = QComboBox()
         for rate in [9600, 19200, 38400, 57600, 115200, 230400]:
             self._baud_combo.addItem(str(rate))
@@ -153,25 +221,28 @@ class ConnectionWidget(QWidget):
         self._state_label = QLabel(NOT_CONNECTED)
         self._state_label.setMinimumWidth(100)
         self._state_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._state_color = STATECOLOR[NOT_CONNECTED]
         self._state_label.setStyleSheet(
-            f"background-color: {STATECOLOR[NOT_CONNECTED]}; padding: 2px;")
+            f"background-color: {self._state_color}; padding: 2px;")
         layout.addWidget(self._state_label)
 
-    def _populate_ports(self):
-        """Scan for available serial ports."""
+    def _populate_ports(self, force_refresh=False):
+        """Fill the port list from a scan at most PORTS_TTL old.
+
+        The port already chosen (or typed) is kept selected; initially
+        that is the saved [Connection] port.
+        """
+        current = self._port_combo.currentText()
         self._port_combo.clear()
-        try:
-            import serial.tools.list_ports
-            for port in serial.tools.list_ports.comports():
-                self._port_combo.addItem(port.device)
-        except ImportError:
-            pass
+        for device in _serial_ports(force_refresh):
+            self._port_combo.addItem(device)
         # Add saved port
         saved = Utils.getStr("Connection", "port", "")
         if saved and self._port_combo.findText(saved) < 0:
             self._port_combo.addItem(saved)
-        if saved:
-            self._port_combo.setCurrentText(saved)
+        current = current or saved
+        if current:
+            self._port_combo.setCurrentText(current)
 
     def _on_connect(self):
         if self.sender.serial is None:
@@ -189,8 +260,11 @@ class ConnectionWidget(QWidget):
     def update_state(self, state, color):
         """Update connection state display."""
         self._state_label.setText(state)
-        self._state_label.setStyleSheet(
-            f"background-color: {color}; padding: 2px;")
+        # Setting a style sheet re-parses and re-polishes even when equal
+        if color != self._state_color:
+            self._state_color = color
+            self._state_label.setStyleSheet(
+                f"background-color: {color}; padding: 2px;")
         if self.sender.serial is not None:
             self._connect_btn.setText("Disconnect")
         else:
@@ -361,15 +435,30 @@ class StateWidget(QWidget):
 
         layout.addLayout(sc_layout, 4, 0, 1, 4)
 
+        # Readout labels in update_state() order, with the text they show
+        self._labels = (
+            self._feed_label, self._spindle_label, self._ov_feed_label,
+            self._ov_spindle_label, self._ov_rapid_label,
+        )
+        self._texts = tuple(lbl.text() for lbl in self._labels)
+
     def update_state(self, state, color):
         """Update all readout labels from CNC.vars."""
-        self._feed_label.setText(f"{CNC.vars['curfeed']:.0f}")
-        self._spindle_label.setText(f"{CNC.vars['curspindle']:.0f}")
-        self._ov_feed_label.setText(f"{CNC.vars['OvFeed']}%")
-        self._ov_spindle_label.setText(f"{CNC.vars['OvSpindle']}%")
-        self._ov_rapid_label.setText(f"{CNC.vars['OvRapid']}%")
+        cnc_vars = CNC.vars
+        texts = (
+            f"{cnc_vars['curfeed']:.0f}",
+            f"{cnc_vars['curspindle']:.0f}",
+            f"{cnc_vars['OvFeed']}%",
+            f"{cnc_vars['OvSpindle']}%",
+            f"{cnc_vars['OvRapid']}%",
+        )
+        if texts != self._texts:
+            for lbl, text, last in zip(self._labels, texts, self._texts):
+                if text != last:
+                    lbl.setText(text)
+            self._texts = texts
         # Update spindle button state
-        is_on = CNC.vars.get("spindle", "M5") in ("M3", "M4")
+        is_on = cnc_vars.get("spindle", "M5") in ("M3", "M4")
         self._spindle_btn.setChecked(is_on)
         self._spindle_btn.setText("Spindle OFF" if is_on else "Spindle ON")
 
@@ -440,7 +529,7 @@ class MacroEditDialog(QDialog):
         layout.addWidget(self._tooltip)
 
         layout.addWidget(QLabel("Command:"))
-        self._command = QTextEdit()
+        self._command = QPlainTextEdit()
         self._command.setPlainText(
             Utils.config.get("Buttons", f"command.{index}", fallback=""))
         self._command.setMinimumHeight(120)
@@ -473,6 +562,7 @@ class MacroButtonsWidget(QWidget):
         super().__init__(parent)
         self.sender = sender
         self._buttons = []
+        self._btn_cfg = {}  # [Buttons] snapshot taken by _build_buttons()
 
         self._layout = QGridLayout(self)
         self._layout.setContentsMargins(2, 2, 2, 2)
@@ -484,10 +574,15 @@ class MacroButtonsWidget(QWidget):
             btn.deleteLater()
         self._buttons.clear()
 
+        # Read the section once instead of querying it per button
+        if Utils.config.has_section("Buttons"):
+            self._btn_cfg = dict(Utils.config.items("Buttons"))
+        else:
+            self._btn_cfg = {}
         n = Utils.getInt("Buttons", "n", 6)
         for i in range(1, n):  # Skip button 0 (Tkinter jog-pad origin)
-            name = Utils.config.get("Buttons", f"name.{i}", fallback=str(i))
-            tooltip = Utils.config.get("Buttons", f"tooltip.{i}", fallback="")
+            name = self._btn_cfg.get(f"name.{i}", str(i))
+            tooltip = self._btn_cfg.get(f"tooltip.{i}", "")
             btn = QPushButton(name)
             btn.setToolTip(tooltip or "Right-click to configure")
             btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -499,7 +594,7 @@ class MacroButtonsWidget(QWidget):
             self._buttons.append(btn)
 
     def _execute(self, index):
-        cmd = Utils.config.get("Buttons", f"command.{index}", fallback="")
+        cmd = self._btn_cfg.get(f"command.{index}", "")
         if not cmd:
             self._edit(index)
             return
@@ -627,8 +722,9 @@ class ControlPanel(QWidget):
     def _update_wcs(self):
         """Highlight the active WCS button from CNC.vars."""
         active = CNC.vars.get("WCS", "G54")
-        for btn in self._wcs_buttons:
-            btn.setChecked(btn.text() == active)
+        # Buttons were created in WCS order; avoids a text() call each
+        for wcs, btn in zip(WCS, self._wcs_buttons):
+            btn.setChecked(wcs == active)
 
     def _zero_axis(self, axis):
         """Zero a single axis via G10 L20."""
@@ -1,7 +1,8 @@
 # Qt tree model for gcode blocks and lines
 #
 # Two-level hierarchy: blocks are root rows, gcode lines are children.
-# References gcode.blocks directly — no parallel arrays to sync.
+# References gcode.blocks directly; only the row counts are cached,
+# and refresh() rebuilds them after every structural mutation.
 
 from PySide6.QtCore import Qt, QModelIndex, QAbstractItemModel
 from PySide6.QtGui import QColor
@@ -26,11 +27,18 @@ class GCodeTreeModel(QAbstractItemModel):
     def __init__(self, gcode, parent=None):
         super().__init__(parent)
         self.gcode = gcode
+        self._block_lens = ()
+        self._update_lens()
+
+    def _update_lens(self):
+        """Cache the line count of every block, see rowCount()."""
+        self._block_lens = tuple(len(block) for block in self.gcode.blocks)
 
     # ---- structure --------------------------------------------------------
 
     def index(self, row, column, parent=QModelIndex()):
-        if not self.hasIndex(row, column, parent):
+        # Same test as hasIndex(), without calling back through C++
+        if row < 0 or column != 0 or row >= self.rowCount(parent):
             return QModelIndex()
         if not parent.isValid():
             # Block row
@@ -50,13 +58,13 @@ class GCodeTreeModel(QAbstractItemModel):
 
     def rowCount(self, parent=QModelIndex()):
         if not parent.isValid():
-            return len(self.gcode.blocks)
+            return len(self._block_lens)
         iid = parent.internalId()
         if iid == _BLOCK_ID:
             # parent is a block — children are its lines
             bid = parent.row()
-            if 0 <= bid < len(self.gcode.blocks):
-                return len(self.gcode.blocks[bid])
+            if 0 <= bid < len(self._block_lens):
+                return self._block_lens[bid]
             return 0
         # lines have no children
         return 0
@@ -158,6 +166,7 @@ class GCodeTreeModel(QAbstractItemModel):
     def refresh(self):
         """Full reset after any structural mutation."""
         self.beginResetModel()
+        self._update_lens()
         self.endResetModel()
 
     # ---- helpers ----------------------------------------------------------
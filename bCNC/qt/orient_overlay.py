@@ -50,17 +50,10 @@ class OrientOverlay:
             group = []
 
             # Project machine position and gcode position
-            m_coords = ViewTransform.project_3d_to_2d(
-                [(xm, ym, 0)], view_mode, zoom)
-            g_coords = ViewTransform.project_3d_to_2d(
-                [(x, y, 0)], view_mode, zoom)
-
-            if not m_coords or not g_coords:
-                self._marker_items.append(group)
-                continue
-
-            mcx, mcy = m_coords[0]
-            gcx, gcy = g_coords[0]
+            mcx, mcy = ViewTransform.project_point_3d_to_2d(
+                xm, ym, 0, view_mode, zoom)
+            gcx, gcy = ViewTransform.project_point_3d_to_2d(
+                x, y, 0, view_mode, zoom)
 
             # Green cross at machine position
             items = self._draw_cross(mcx, mcy, CROSS_ARM, COLOR_MACHINE, 1)
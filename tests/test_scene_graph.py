@@ -0,0 +1,155 @@
+"""Tests for the toolkit-independent SceneGraph."""
+
+import os
+import sys
+import unittest
+
+# bCNC import path setup
+_root = os.path.join(os.path.dirname(__file__), "..")
+for sub in ("bCNC", "bCNC/lib"):
+    p = os.path.join(_root, sub)
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+import numpy as np  # noqa: E402
+
+from SceneGraph import LinePrimitive, Scene, TextPrimitive  # noqa: E402
+
+
+class TestLinePrimitiveExtras(unittest.TestCase):
+    """dash/arrow/cap/metadata share the _extras slot."""
+
+    def test_defaults_leave_extras_empty(self):
+        line = LinePrimitive([(0, 0), (1, 1)])
+        self.assertIsNone(line._extras)
+        self.assertIsNone(line.dash)
+        self.assertIsNone(line.metadata)
+
+    def test_metadata_keyword(self):
+        data = {"z": 3}
+        line = LinePrimitive([(0, 0), (1, 1)], dash=(3, 1), metadata=data)
+        self.assertIs(line.metadata, data)
+        self.assertEqual(line.dash, (3, 1))
+        self.assertIsNone(line.arrow)
+
+    def test_unset_all_extras(self):
+        line = LinePrimitive([(0, 0), (1, 1)], metadata={"a": 1})
+        line.metadata = None
+        self.assertIsNone(line._extras)
+
+
+class TestSceneMetadata(unittest.TestCase):
+    """Scene.set_metadata()/get_metadata() keyed by primitive."""
+
+    def setUp(self):
+        self.scene = Scene()
+        self.paths = self.scene.layer("paths")
+        self.text = self.scene.layer("text", z_order=1)
+        self.line = self.paths.add(LinePrimitive([(0, 0), (5, 5)]))
+        self.label = self.text.add(TextPrimitive(1, 2, "X"))
+
+    def test_set_and_get(self):
+        self.assertIsNone(self.scene.get_metadata(self.line))
+        self.scene.set_metadata(self.line, {"item": 7})
+        self.assertEqual(self.scene.get_metadata(self.line), {"item": 7})
+        self.assertIsNone(self.scene.get_metadata(self.label))
+
+    def test_set_none_removes(self):
+        self.scene.set_metadata(self.line, {"item": 7})
+        self.scene.set_metadata(self.line, None)
+        self.assertIsNone(self.scene.get_metadata(self.line))
+
+    def test_clear_layer_drops_only_its_metadata(self):
+        self.scene.set_metadata(self.line, {"item": 1})
+        self.scene.set_metadata(self.label, {"item": 2})
+        self.scene.clear("paths")
+        self.assertIsNone(self.scene.get_metadata(self.line))
+        self.assertEqual(self.scene.get_metadata(self.label), {"item": 2})
+
+    def test_clear_all(self):
+        self.scene.set_metadata(self.line, {"item": 1})
+        self.scene.set_metadata(self.label, {"item": 2})
+        self.scene.clear()
+        self.assertIsNone(self.scene.get_metadata(self.line))
+        self.assertIsNone(self.scene.get_metadata(self.label))
+
+
+class TestLineStore(unittest.TestCase):
+    """SceneLayer.add_line() int16 store and line_batches()."""
+
+    def setUp(self):
+        self.layer = Scene().layer("paths")
+
+    def test_round_trip_to_nearest_pixel(self):
+        coords = [(0.0, 0.0), (10.4, -3.6), (1234.5, 99.49)]
+        idx = self.layer.add_line(coords)
+        stored = self.layer.line_coords[idx]
+        self.assertEqual(stored.dtype, np.int16)
+        self.assertEqual(stored.shape, (3, 2))
+        # whole-pixel precision: never more than half a pixel off
+        self.assertTrue(np.all(np.abs(stored - np.array(coords)) <= 0.5))
+        np.testing.assert_array_equal(
+            stored, [[0, 0], [10, -4], [1234, 99]])
+
+    def test_out_of_range_is_clamped(self):
+        idx = self.layer.add_line([(-1e6, 40000.0), (32767.4, -32768.6)])
+        np.testing.assert_array_equal(
+            self.layer.line_coords[idx],
+            [[-32768, 32767], [32767, -32768]])
+
+    def test_batches_group_by_style(self):
+        self.layer.add_line([(0, 0), (1, 1)], fill="red", width=2)
+        self.layer.add_line([(2, 2), (3, 3)], fill="blue", dash=(3, 1))
+        self.layer.add_line([(4, 4), (5, 5)], fill="red", width=2)
+        batches = self.layer.line_batches()
+        self.assertEqual(list(batches), [("red", 2, None),
+                                         ("blue", 1, (3, 1))])
+        red = batches[("red", 2, None)]
+        self.assertEqual(len(red), 2)
+        np.testing.assert_array_equal(red[1], [[4, 4], [5, 5]])
+
+    def test_clear_empties_store(self):
+        self.layer.add_line([(0, 0), (1, 1)], fill="red")
+        self.layer.clear()
+        self.assertEqual(self.layer.line_count(), 0)
+        self.assertEqual(self.layer.line_batches(), {})
+
+
+class TestSceneFlatten(unittest.TestCase):
+    """Scene.flatten() caches until a layer changes."""
+
+    def setUp(self):
+        self.scene = Scene()
+        self.back = self.scene.layer("grid", z_order=0)
+        self.front = self.scene.layer("paths", z_order=5)
+        self.a = self.back.add(LinePrimitive([(0, 0), (1, 0)]))
+        self.b = self.front.add(LinePrimitive([(0, 0), (0, 1)]))
+
+    def test_cached_when_unchanged(self):
+        first = self.scene.flatten()
+        self.assertEqual(first, [self.a, self.b])
+        self.assertIs(self.scene.flatten(), first)
+
+    def test_add_invalidates(self):
+        first = self.scene.flatten()
+        c = self.back.add(LinePrimitive([(1, 1), (2, 2)]))
+        second = self.scene.flatten()
+        self.assertIsNot(second, first)
+        self.assertEqual(second, [self.a, c, self.b])
+
+    def test_clear_invalidates(self):
+        self.scene.flatten()
+        self.scene.clear("paths")
+        self.assertEqual(self.scene.flatten(), [self.a])
+
+    def test_visibility_and_new_layer_invalidate(self):
+        self.scene.flatten()
+        self.front.visible = False
+        self.assertEqual(self.scene.flatten(), [self.a])
+        under = self.scene.layer("margin", z_order=-1)
+        m = under.add(LinePrimitive([(5, 5), (6, 6)]))
+        self.assertEqual(self.scene.flatten(), [m, self.a])
+
+
+if __name__ == "__main__":
+    unittest.main()